@@ -1,6 +1,9 @@
-from hamilton_composer.cli.factory import build_cli
-from hamilton_composer.composer import HamiltonComposer
-from hamilton_composer.pipeline import Pipeline
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from hamilton_composer.cli.factory import build_cli
+    from hamilton_composer.composer import HamiltonComposer
+    from hamilton_composer.pipeline import Pipeline
 
 __version__ = "0.1.1"
 
@@ -10,3 +13,25 @@ __all__ = [
     "Pipeline",
     "build_cli",
 ]
+
+# NOTE: Public objects are imported on first attribute access (PEP 562) so that importing the
+#       package, or one of its sub-modules, does not pull in the CLI, composer and pipeline chains.
+_LAZY_IMPORTS = {
+    "HamiltonComposer": "hamilton_composer.composer",
+    "Pipeline": "hamilton_composer.pipeline",
+    "build_cli": "hamilton_composer.cli.factory",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,33 @@
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from hamilton_composer.cli.cmds.completion import generate_completion
+    from hamilton_composer.cli.cmds.list import list_pipelines
+    from hamilton_composer.cli.cmds.run import run_pipelines
+    from hamilton_composer.cli.cmds.shell import launch_ipython_shell
+
+__all__ = [
+    "generate_completion",
+    "launch_ipython_shell",
+    "list_pipelines",
+    "run_pipelines",
+]
+
+# NOTE: Commands are imported from their modules on first attribute access (PEP 562) so that the
+#       CLI application only loads the module of the subcommand that is actually invoked.
+_LAZY_COMMANDS = {
+    "generate_completion": "completion",
+    "list_pipelines": "list",
+    "run_pipelines": "run",
+    "launch_ipython_shell": "shell",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_COMMANDS:
+        from importlib import import_module
+
+        value = getattr(import_module(f".{_LAZY_COMMANDS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,114 @@
+import re
+
+import click
+
+from hamilton_composer.cli.factory import CONTEXT_SETTINGS
+
+_BASH_TEMPLATE = """\
+_{func}_completion() {{
+    local cur="${{COMP_WORDS[COMP_CWORD]}}" command="" word
+    for word in "${{COMP_WORDS[@]:1:COMP_CWORD-1}}"; do
+        case "$word" in
+            {commands}) command="$word"; break ;;
+        esac
+    done
+    case "$command" in
+{cases}
+    esac
+}}
+complete -o default -F _{func}_completion {prog}
+"""
+
+_BASH_CASE = '        {pattern}) COMPREPLY=($(compgen -W "{words}" -- "$cur")) ;;'
+
+
+@click.command(name="completion", context_settings=CONTEXT_SETTINGS)
+@click.argument("shell", type=click.Choice(["bash", "zsh", "fish"]))
+@click.pass_context
+def generate_completion(ctx: click.Context, shell: str) -> None:
+    """
+    Print a static SHELL completion script for the application.
+
+    The script is generated once from the available commands so that tab completion does not
+    invoke Python. Source the output from your shell profile, for example with
+    `eval "$(<app> completion bash)"`, and regenerate it whenever plugins are added.
+    """
+    root = ctx.find_root()
+    prog = root.info_name or root.command.name or "app"
+    assert isinstance(root.command, click.Group)
+
+    subcommands: dict[str, click.Command] = {}
+    for name in root.command.list_commands(root):
+        command = root.command.get_command(root, name)
+        if command is not None and not command.hidden:
+            subcommands[name] = command
+
+    if shell == "fish":
+        click.echo(_fish_script(prog, root, subcommands))
+        return
+
+    cases = [
+        _BASH_CASE.format(pattern=name, words=" ".join(_command_words(command, root)))
+        for name, command in subcommands.items()
+    ]
+    cases.append(_BASH_CASE.format(pattern="*", words=" ".join(_command_words(root.command, root))))
+    script = _BASH_TEMPLATE.format(
+        func=re.sub(r"\W", "_", prog),
+        prog=prog,
+        commands="|".join(subcommands) or "''",
+        cases="\n".join(cases),
+    )
+    if shell == "zsh":
+        script = "autoload -U +X bashcompinit && bashcompinit\n" + script
+    click.echo(script, nl=False)
+
+
+def _command_words(command: click.Command, ctx: click.Context) -> list[str]:
+    """Returns the option names, argument choices and subcommand names (groups) of a command."""
+    words = [
+        name
+        for param in command.get_params(ctx)
+        if isinstance(param, click.Option) and not param.hidden
+        for name in (*param.opts, *param.secondary_opts)
+    ]
+    words.extend(_argument_choices(command, ctx))
+    if isinstance(command, click.Group):
+        words.extend(command.list_commands(ctx))
+    return words
+
+
+def _argument_choices(command: click.Command, ctx: click.Context) -> list[str]:
+    """Returns the fixed choices of the positional arguments of a command."""
+    return [
+        str(choice)
+        for param in command.get_params(ctx)
+        if isinstance(param, click.Argument) and isinstance(param.type, click.Choice)
+        for choice in param.type.choices
+    ]
+
+
+def _fish_script(prog: str, ctx: click.Context, subcommands: dict[str, click.Command]) -> str:
+    """Returns the fish completion script for the application."""
+    names = " ".join(subcommands)
+    conditions = {"": f"not __fish_seen_subcommand_from {names}" if names else ""}
+    conditions.update({name: f"__fish_seen_subcommand_from {name}" for name in subcommands})
+    commands = {"": ctx.command, **subcommands}
+
+    lines = []
+    for key, command in commands.items():
+        condition = f" -n '{conditions[key]}'" if conditions[key] else ""
+        for param in command.get_params(ctx):
+            if not isinstance(param, click.Option) or param.hidden:
+                continue
+            flags = "".join(
+                f" -l {name[2:]}" if name.startswith("--") else f" -s {name[1:]}"
+                for name in (*param.opts, *param.secondary_opts)
+            )
+            required = "" if param.is_flag or param.count else " -r"
+            lines.append(f"complete -c {prog}{condition}{flags}{required}")
+        words = _argument_choices(command, ctx)
+        if isinstance(command, click.Group):
+            words.extend(command.list_commands(ctx))
+        if words:
+            lines.append(f"complete -c {prog}{condition} -f -a '{' '.join(words)}'")
+    return "\n".join(lines)
@@ -2,6 +2,8 @@ from typing import TYPE_CHECKING
 
 import click
 
+from hamilton_composer.cli.factory import CONTEXT_SETTINGS
+
 if TYPE_CHECKING:
     from hamilton_composer.cli.context import AppContext
 else:
@@ -11,6 +13,7 @@ else:
 @click.command(
     name="run",
     short_help="Execute a specific PIPELINE from the project.",
+    context_settings=CONTEXT_SETTINGS,
 )
 @click.argument("pipeline_name", required=True)
 @click.argument("params", nargs=-1, type=str, default=None)
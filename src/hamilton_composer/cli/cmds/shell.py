@@ -8,8 +8,10 @@ else:
 
 import click
 
+from hamilton_composer.cli.factory import CONTEXT_SETTINGS
 
-@click.command(name="shell")
+
+@click.command(name="shell", context_settings=CONTEXT_SETTINGS)
 @click.argument("params", nargs=-1, type=str, default=None)
 @click.pass_obj
 def launch_ipython_shell(context: AppContext, params: tuple[str, ...]) -> None:
@@ -13,6 +13,19 @@ else:
 class AppContext:
     """Context manager for the a Hamilton composer application."""
 
+    __slots__ = (
+        "_project_name",
+        "_composer",
+        "_logger",
+        "_config_path",
+        "_search_recursive",
+        "_search_git_root",
+        "_cached_pipelines",
+        "_cached_config",
+        "_cached_public_pipelines",
+        "_cached_public_config",
+    )
+
     def __init__(
         self,
         name: str,
@@ -31,6 +44,8 @@ class AppContext:
         self._search_git_root = search_git_root
         self._cached_pipelines: dict[str, Pipeline] | None = None
         self._cached_config: dict[str, Any] | None = None
+        self._cached_public_pipelines: list[tuple[str, Pipeline]] | None = None
+        self._cached_public_config: dict[str, Any] | None = None
 
     @property
     def name(self) -> str:
@@ -57,3 +72,19 @@ class AppContext:
         """Delegates pipelines search to the Hamilton composer within the current context."""
         config = config if config else {}
         return self._composer.find_pipelines(config)
+
+    def find_public_pipelines(
+        self, config: dict[str, Any] | None = None
+    ) -> list[tuple[str, Pipeline]]:
+        """
+        Returns the public pipelines, sorted by name, within the current context.
+
+        The result is cached and reused for as long as the same configuration object is passed.
+        """
+        if self._cached_public_pipelines is None or self._cached_public_config is not config:
+            pipelines = self.find_pipelines(config)
+            self._cached_public_pipelines = [
+                (name, pipeline) for name, pipeline in sorted(pipelines.items()) if pipeline.public
+            ]
+            self._cached_public_config = config
+        return self._cached_public_pipelines
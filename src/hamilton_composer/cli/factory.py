@@ -4,9 +4,7 @@ from typing import TYPE_CHECKING, Iterable
 
 import click
 
-from hamilton_composer.cli.cmds.list import list_pipelines
-from hamilton_composer.cli.cmds.run import run_pipelines
-from hamilton_composer.cli.cmds.shell import launch_ipython_shell
+from hamilton_composer.cli import cmds
 
 if TYPE_CHECKING:
     from hamilton_composer.composer import HamiltonComposer
@@ -15,6 +13,63 @@ else:
 
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"], "max_content_width": 120}
 
+# Subcommands that execute pipelines (or user code) and therefore benefit from pretty errors
+_EXECUTING_SUBCOMMANDS = frozenset({"run", "shell", "plugins"})
+
+# Subcommands that always load the configuration (and OmegaConf, if a configuration path is set)
+_CONFIG_SUBCOMMANDS = frozenset({"run", "shell"})
+
+# Built-in subcommand names mapped to their (lazily imported) command objects in `cli.cmds`
+SUBCOMMANDS = {
+    "completion": "generate_completion",
+    "list": "list_pipelines",
+    "run": "run_pipelines",
+    "shell": "launch_ipython_shell",
+}
+
+# Options of the main group that do not depend on the `build_cli` arguments (in REVERSE order)
+_STATIC_OPTIONS = (
+    click.option(
+        "--debug",
+        "-d",
+        is_flag=True,
+        default=False,
+        help="Enable debug mode for the pipeline execution.",
+    ),
+    click.option(
+        "--search-recursive",
+        "-r",
+        is_flag=True,
+        default=False,
+        help=(
+            "Search for the configuration path recursively in parent directories. Only used if "
+            "`--config-path` is a relative path (either the specified or default value)."
+        ),
+    ),
+    click.option(
+        "--search-git-root",
+        "-g",
+        is_flag=True,
+        default=False,
+        help=(
+            "Search for the configuration path relative to the git root. Only used if "
+            "`--config-path` is a relative path (either the specified or default value)."
+        ),
+    ),
+)
+
+
+class _LazyGroup(click.Group):
+    """Click group that only imports built-in subcommands when they are requested."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *SUBCOMMANDS})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in SUBCOMMANDS and cmd_name not in self.commands:
+            self.add_command(cmd=getattr(cmds, SUBCOMMANDS[cmd_name]))
+        return super().get_command(ctx, cmd_name)
+
 
 def build_cli(
     project_name: str,
@@ -46,8 +101,6 @@ def build_cli(
         plugins (Iterable[click.Command], optional):
             Additional click commands that will be nested under the `plugins` subcommand.
     """
-    from hamilton_composer.cli.context import AppContext
-    from hamilton_composer.logging import configure_logging
     from hamilton_composer.logging import get_default_logger
 
     if logger is None:
@@ -58,12 +111,17 @@ def build_cli(
     # Main group function
     def main(ctx: click.Context, debug: bool, **kwargs) -> None:
         """Hamilton composer application command line."""
-        from colorama import init
-        from rich.traceback import install
+        from hamilton_composer.cli.context import AppContext
+        from hamilton_composer.logging import configure_logging
 
-        init(autoreset=True)
-        install(show_locals=False, suppress=[click])
-        _patch_hamilton_message()
+        if ctx.invoked_subcommand in _EXECUTING_SUBCOMMANDS:
+            _install_pretty_errors()
+
+        if ctx.invoked_subcommand in _CONFIG_SUBCOMMANDS and kwargs["config_path"] is not None:
+            # NOTE: OmegaConf registers its default resolvers on import, import it here so that the
+            #       one time cost is paid (and profiled) up front rather than in `load_config`. Only
+            #       done when a configuration path is set, otherwise it may not be needed at all.
+            import omegaconf  # noqa: F401
 
         if logger:
             configure_logging(logger, log_file=log_file, debug=debug)
@@ -80,36 +138,9 @@ def build_cli(
     # Add click decorators dynamically to the main group (needs to be in REVERSE order)
     app = click.pass_context(main)
 
-    app = click.option(
-        "--debug",
-        "-d",
-        is_flag=True,
-        default=False,
-        help="Enable debug mode for the pipeline execution.",
-    )(app)
+    for option in _STATIC_OPTIONS:
+        app = option(app)
 
-    app = click.option(
-        "--search-recursive",
-        "-r",
-        is_flag=True,
-        default=False,
-        help=(
-            "Search for the configuration path recursively in parent directories. Only used if "
-            "`--config-path` is a relative path (either the specified or default value)."
-        ),
-    )(app)
-
-    app = click.option(
-        "--search-git-root",
-        "-g",
-        is_flag=True,
-        default=False,
-        help=(
-            "Search for the configuration path relative to the git root. Only used if "
-            "`--config-path` is a relative path (either the specified or default value)."
-        ),
-    )(app)
-
     app = click.option(
         "--config-path",
         "-c",
@@ -124,14 +155,12 @@ def build_cli(
     # Create the main CLI application group
     app = click.group(
         name=project_name,
+        cls=_LazyGroup,
         help=help or getattr(main, "__doc__", "Hamilton Composer CLI Application"),
         context_settings=CONTEXT_SETTINGS,
     )(app)
 
-    # Register the subcommands with the main CLI application group
-    for cmd in [list_pipelines, run_pipelines, launch_ipython_shell]:
-        cmd.context_settings = CONTEXT_SETTINGS
-        app.add_command(cmd=cmd)
+    # NOTE: Built-in subcommands are registered on demand by `_LazyGroup.get_command`
 
     # Register the plugins subcommand if plugins have been provided
     if plugins:
@@ -148,6 +177,16 @@ def build_cli(
     return app
 
 
+def _install_pretty_errors() -> None:
+    """Installs colored output and rich tracebacks (deferred, the imports are costly)."""
+    from colorama import init
+    from rich.traceback import install
+
+    init(autoreset=True)
+    install(show_locals=False, suppress=[click])
+    _patch_hamilton_message()
+
+
 def _patch_hamilton_message() -> None:  # pragma no cover
     """Removes the hamilton slack error message."""
     import hamilton.driver
@@ -1,22 +1,52 @@
+import copy
+import os
+import re
+import stat
+import threading
 import warnings
 from dataclasses import fields
 from dataclasses import is_dataclass
+from functools import cached_property
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Iterable, cast, overload
-
-from hamilton_composer.utils import get_git_root
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal, cast, overload
 
 if TYPE_CHECKING:
+    from omegaconf import DictConfig
+
     from hamilton_composer.pipeline import Pipeline
 
     PipelineFunction = Callable[[dict[str, Any] | None], dict[str, Pipeline]]
 else:
+    DictConfig = object
     Pipeline = object
     PipelineFunction = object
 
 
 _MISSING = object()
 
+# Maximum number of parsed configuration files kept (process-wide) by `_load_config_file`
+_CONFIG_FILE_CACHE_SIZE = 32
+
+# Parsed configuration files keyed by path, modification time and size (guarded by the lock)
+_config_file_cache: dict[tuple[str, int, int], Any] = {}
+_config_file_cache_lock = threading.Lock()
+
+# Maximum number of pipeline dictionaries (one per distinct configuration) kept by each composer
+_PIPELINES_CACHE_SIZE = 4
+
+# Incremented by `clear_config_cache`, pipelines cached under an older generation are discarded
+_pipelines_cache_generation = 0
+
+# Configuration values that may be part of a pipelines cache key (compared by type and value)
+_FREEZABLE_SCALARS = (str, int, float, bool, bytes, type(None))
+
+# Minimum number of files in a configuration directory before they are loaded concurrently
+_CONCURRENT_LOAD_THRESHOLD = 8
+
+# Plain `key.path=value` overrides: no escapes, brackets, interpolations or flow collections
+_SIMPLE_OVERRIDE = re.compile(r"^[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*=[^\[\]{}:$\n]*$")
+
 
 class HamiltonComposer:
     """
@@ -41,6 +71,11 @@ class HamiltonComposer:
             not provided, no validation is performed. Must be either a dataclass either from the
             standard library or a compatible library (i.e. pydantic). For more information on
             see https://omegaconf.readthedocs.io/en/latest/structured_config.html.
+        cache_pipelines (bool, optional):
+            If True, `find_pipelines` caches the pipelines created for plain configurations (the
+            result of `load_config` without a schema) and returns the same `Pipeline` instances for
+            equal configurations. Only enable this when the pipeline function is deterministic and
+            the returned pipelines are not mutated by callers. Defaults to False.
     """
 
     def __init__(
@@ -49,14 +84,26 @@ class HamiltonComposer:
         config_path: str | Path | None = None,
         schema: type | None = None,
         *,
+        cache_pipelines: bool = False,
         config_file: object = _MISSING,
     ) -> None:
-        if not isinstance(pipeline_function, str) and not callable(pipeline_function):
+        # NOTE: Names are split once here, a valid name has a non-empty module and function part
+        function_path: list[str] = []
+        if isinstance(pipeline_function, str):
+            function_path = pipeline_function.rsplit(".", 1)
+            is_valid = len(function_path) == 2 and all(function_path)
+        else:
+            is_valid = callable(pipeline_function)
+        if not is_valid:
             raise TypeError(
                 "pipeline_function must be a callable or a string representing the fully "
                 "qualified name of a module and function."
             )
         self._pipeline_function = pipeline_function
+        self._create_pipelines_func: PipelineFunction | None = None
+        self._pipeline_function_path = function_path
+        if not isinstance(pipeline_function, str):
+            self._create_pipelines_func = pipeline_function
         if config_file is not _MISSING:
             warnings.warn(
                 "The 'config_file' parameter is deprecated. Please use 'config_path' instead.",
@@ -71,8 +118,12 @@ class HamiltonComposer:
             config_path = cast(str | Path | None, config_file)
 
         self._config_path = config_path
+        self._cache_pipelines = cache_pipelines
+        self._pipelines_cache: dict[tuple, dict[str, Pipeline]] = {}
+        self._pipelines_cache_generation = _pipelines_cache_generation
 
         self._schema = None
+        self._schema_field_names: tuple[str, ...] = ()
         if schema:
             if not is_dataclass(schema):
                 raise ValueError(
@@ -82,19 +133,65 @@ class HamiltonComposer:
                 raise ValueError("Schema must be a dataclass type vice a dataclass instance.")
 
             self._schema = schema
+            self._schema_field_names = tuple(field.name for field in fields(schema))
 
     @property
     def config_path(self) -> Path | None:
         """Returns the location of the configuration path (relative or absolute)."""
         return Path(self._config_path) if self._config_path is not None else None
 
+    @cached_property
+    def _structured_default(self) -> DictConfig:
+        """Structured configuration of the schema (created once, `OmegaConf.merge` copies it)."""
+        from omegaconf import OmegaConf
+
+        return OmegaConf.structured(self._schema)
+
+    @staticmethod
+    def clear_config_cache() -> None:
+        """
+        Clears the process-wide caches of resolved configuration paths and parsed files.
+
+        Pipelines cached by composers created with `cache_pipelines=True` are discarded as well.
+        """
+        global _pipelines_cache_generation
+
+        _search_config_path.cache_clear()
+        with _config_file_cache_lock:
+            _config_file_cache.clear()
+        _pipelines_cache_generation += 1
+
+    @overload
+    def load_config(
+        self,
+        path: str | Path | None = None,
+        params: Iterable[str] | None = None,
+        search_git_root: bool = False,
+        search_recursive: bool = False,
+        *,
+        raw: Literal[False] = False,
+    ) -> dict[str, Any]: ...
+
+    @overload
+    def load_config(
+        self,
+        path: str | Path | None = None,
+        params: Iterable[str] | None = None,
+        search_git_root: bool = False,
+        search_recursive: bool = False,
+        *,
+        raw: Literal[True],
+    ) -> DictConfig | dict[str, Any]: ...
+
     def load_config(
         self,
         path: str | Path | None = None,
         params: Iterable[str] | None = None,
         search_git_root: bool = False,
         search_recursive: bool = False,
-    ) -> dict[str, Any]:
+        *,
+        raw: bool = False,
+    ) -> DictConfig | dict[str, Any]:
         """
         Loads the configuration for the composer using OmegaConf.
 
@@ -114,32 +211,45 @@ class HamiltonComposer:
             search_recursive (bool, optional):
                 If True, searches for the config path recursively from the current working
                 directory. Defaults to False. Ignored if `path` is an absolute path.
+            raw (bool, optional):
+                If True, the composed OmegaConf `DictConfig` is returned without resolving
+                interpolations or converting it to a dictionary, values are resolved on access
+                instead. Ignored when a schema is set, structured configs are always materialized.
+                Defaults to False.
 
         Returns:
             The composed configuration as a dictionary or an instance of the current schema.
 
         """
-        from omegaconf import OmegaConf
-
         config_path = self._resolve_config_path(
             path if path is not None else self._config_path,
             search_git_root=search_git_root,
             search_recursive=search_recursive,
         )
+        dotlist = list(params) if params else []
 
-        params = OmegaConf.from_dotlist(list(params)) if params else OmegaConf.create()
+        # Nothing to compose or validate, avoid importing and invoking OmegaConf entirely
+        if config_path is None and not dotlist and self._schema is None and not raw:
+            return {}
+
+        from omegaconf import OmegaConf
 
         composed = self._load_config_from_path(config_path)
-        composed = OmegaConf.merge(composed, params)
+        if dotlist:
+            composed = OmegaConf.merge(composed, _overrides_from_dotlist(dotlist))
 
         if self._schema:
-            structured_default = OmegaConf.structured(self._schema)
-            merged = OmegaConf.merge(structured_default, composed)
+            merged = OmegaConf.merge(self._structured_default, composed)
             instance = OmegaConf.to_object(merged)
             assert is_dataclass(instance), "Schema must be a dataclass type."
-            config = {field.name: getattr(instance, field.name) for field in fields(instance)}
+            config = {name: getattr(instance, name) for name in self._schema_field_names}
             return config
 
+        if raw:
+            assert OmegaConf.is_dict(composed)
+            # NOTE: Without overrides this may be a cached file configuration, it is never exposed
+            return cast(DictConfig, composed if dotlist else copy.deepcopy(composed))
+
         container = cast(dict[str, Any], OmegaConf.to_container(composed, resolve=True))
         assert isinstance(container, dict)
         return container
@@ -160,23 +270,47 @@ class HamiltonComposer:
         Args:
             config (dict[str, Any], optional):
                 Configuration parameters for pipeline creation. These will be passed to the pipeline
-                creation function. If not provided, an empty dictionary will be used.
+                creation function. If not provided, an empty dictionary will be used. An unresolved
+                `DictConfig` (see `load_config(raw=True)`) may also be passed as-is.
 
         Returns:
             A dictionary mapping pipeline names to their respective Pipeline instances.
-        """
-        from importlib import import_module
-
-        if isinstance(self._pipeline_function, str):
-            module_name, func_name = self._pipeline_function.rsplit(".", 1)
-            module = import_module(module_name)
-            create_pipelines_func = getattr(module, func_name, None)
-            if create_pipelines_func is None:  # pragma: no cover
-                raise ValueError(f"Function '{func_name}' not found in module '{module_name}'")
-        else:
-            create_pipelines_func = self._pipeline_function
 
-        return create_pipelines_func(config)
+        Note:
+            When the composer was created with `cache_pipelines=True`, repeated calls with an equal
+            plain configuration (same keys, value types and values) return the same `Pipeline`
+            instances in a new dictionary.
+        """
+        key = self._pipelines_cache_key(config) if self._cache_pipelines else None
+        if key is not None and key in self._pipelines_cache:
+            pipelines = self._pipelines_cache.pop(key)
+            self._pipelines_cache[key] = pipelines
+            return dict(pipelines)
+
+        create_pipelines_func = self._create_pipelines_func
+
+        # Functions specified by name are imported once, on first use, and reused afterwards
+        if create_pipelines_func is None:
+            create_pipelines_func = _import_pipeline_function(*self._pipeline_function_path)
+            self._create_pipelines_func = create_pipelines_func
+
+        pipelines = create_pipelines_func(config)
+        if key is not None and isinstance(pipelines, dict):
+            if len(self._pipelines_cache) >= _PIPELINES_CACHE_SIZE:
+                del self._pipelines_cache[next(iter(self._pipelines_cache))]
+            self._pipelines_cache[key] = pipelines
+            return dict(pipelines)
+        return pipelines
+
+    def _pipelines_cache_key(self, config: Any) -> tuple | None:
+        """Returns the pipelines cache key for `config`, or None if it should not be cached."""
+        if self._pipelines_cache_generation != _pipelines_cache_generation:
+            self._pipelines_cache.clear()
+            self._pipelines_cache_generation = _pipelines_cache_generation
+        try:
+            return _freeze_config(config)
+        except TypeError:
+            return None  # Not a plain configuration (i.e. schema instances or `DictConfig`)
 
     def _resolve_config_path(
         self,
@@ -187,93 +321,275 @@ class HamiltonComposer:
         """Resolves the location of the configuration path to an absolute path."""
         if initial_path is None:
             return None
-
-        path = Path(initial_path)
-
-        if path.is_absolute():
-            if not path.exists():
-                raise FileNotFoundError(f"Configuration path '{path}' does not exist.")
-            return path.resolve()
-
-        local_path = Path.cwd().joinpath(path)
-        if local_path.exists():
-            return local_path.resolve()
-
-        if search_git_root:
-            git_root = get_git_root(raise_error=False)
-            if git_root is not None:
-                git_path = git_root.joinpath(path)
-                if git_path.exists():
-                    return git_path.resolve()
-
-        if search_recursive:
-            current_dir = Path.cwd()
-            while current_dir != current_dir.parent:
-                candidate_path = current_dir.joinpath(path)
-                if candidate_path.exists():
-                    return candidate_path.resolve()
-                current_dir = current_dir.parent
-
-        raise FileNotFoundError(
-            f"Configuration path '{path}' not found in the current working directory or git root. "
-            f"Consider using an absolute path."
+        return _resolve_config_path(
+            os.getcwd(), str(initial_path), search_git_root, search_recursive
         )
 
     def _load_config_from_path(self, path: Path | None):
         """Load a configuration from a file or directory."""
+        import yaml  # NOTE: Already imported by OmegaConf, no additional cost
         from omegaconf import OmegaConf
         from omegaconf.errors import OmegaConfBaseException
 
         if path is None:
             return OmegaConf.create()
 
-        if path.is_dir():
+        # NOTE: A single `stat` determines the path type and keys the parsed file cache
+        try:
+            path_stat = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration path '{path}' does not exist.") from None
+
+        if stat.S_ISDIR(path_stat.st_mode):
+            yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # libyaml when available
+            # NOTE: Directory entries carry their type from the directory read (no `stat` calls)
+            with os.scandir(path) as iterator:
+                entries = sorted(iterator, key=lambda item: item.name)
+            subdirs = {entry.name for entry in entries if entry.is_dir()}
+            loaded_files = self._load_config_files(
+                [Path(entry.path) for entry in entries if entry.is_file()]
+            )
             config_data: dict[str, Any] = {}
-            for child in sorted(path.iterdir(), key=lambda item: item.name):
-                if child.is_dir():
+            for child in (Path(entry.path) for entry in entries):
+                if child.name in subdirs:
                     key = child.name
                     if key in config_data:
                         raise ValueError(
                             f"Duplicate configuration key '{key}' found while loading '{path}'."
                         )
-                    nested = self._load_config_from_path(child)
-                    config_data[key] = OmegaConf.to_container(nested, resolve=False)
+                    config_data[key] = self._load_config_from_path(child)
                     continue
 
-                if child.is_file():
+                if child in loaded_files:
                     key = child.stem
                     if key in config_data:
                         raise ValueError(
                             f"Duplicate configuration key '{key}' found while loading '{path}'."
                         )
-                    try:
-                        loaded = OmegaConf.load(child)
-                    except (OSError, OmegaConfBaseException) as exc:
+                    loaded = loaded_files[child]
+                    if isinstance(loaded, BaseException):
+                        exc = loaded
                         if isinstance(exc, OSError) and "Invalid loaded object type" in str(exc):
-                            import yaml
-
                             with child.open("r", encoding="utf-8") as stream:
-                                config_data[key] = yaml.safe_load(stream)
+                                config_data[key] = yaml.load(stream, Loader=yaml_loader)
                             continue
                         raise ValueError(f"Failed to load configuration file '{child}'.") from exc
-                    container = OmegaConf.to_container(loaded, resolve=False)
-                    if isinstance(container, dict) and len(container) == 1:
-                        sole_value = next(iter(container.values()))
+                    # NOTE: OmegaConf loads a plain string scalar (i.e. `text`) as `{"text": None}`
+                    if OmegaConf.is_dict(loaded) and len(loaded) == 1:
+                        _, sole_value = next(iter(loaded.items_ex(resolve=False)))
                         if sole_value is None:
-                            import yaml
-
                             with child.open("r", encoding="utf-8") as stream:
-                                yaml_value = yaml.safe_load(stream)
+                                yaml_value = yaml.load(stream, Loader=yaml_loader)
                             if not isinstance(yaml_value, (dict, list)):
                                 config_data[key] = yaml_value
                                 continue
-                    config_data[key] = container
+                    # Loaded configurations are copied (unresolved) into the composite once
+                    config_data[key] = loaded
             return OmegaConf.create(config_data)
 
-        if path.is_file():
+        if stat.S_ISREG(path_stat.st_mode):
             try:
-                return OmegaConf.load(path)
+                return self._load_config_file(path, path_stat)
             except (OSError, OmegaConfBaseException) as exc:
                 raise ValueError(f"Failed to load configuration file '{path}'.") from exc
 
         raise FileNotFoundError(f"Configuration path '{path}' does not exist.")
+
+    def _load_config_file(self, path: Path, path_stat: os.stat_result | None = None) -> Any:
+        """
+        Loads a single configuration file with OmegaConf.
+
+        Parsed files are cached (least recently used) by path, modification time and size so that
+        unchanged files are not parsed again, even by other composers. Callers must not mutate the
+        returned configuration. An existing `stat` of the path can be provided to avoid another.
+        """
+        from omegaconf import OmegaConf
+
+        path_stat = path_stat or path.stat()
+        key = (str(path), path_stat.st_mtime_ns, path_stat.st_size)
+        with _config_file_cache_lock:
+            loaded = _config_file_cache.pop(key, None)
+        if loaded is None:
+            loaded = OmegaConf.load(path)
+        with _config_file_cache_lock:
+            _config_file_cache.pop(key, None)
+            if len(_config_file_cache) >= _CONFIG_FILE_CACHE_SIZE:
+                del _config_file_cache[next(iter(_config_file_cache))]
+            _config_file_cache[key] = loaded
+        return loaded
+
+    def _load_config_files(self, paths: list[Path]) -> dict[Path, Any]:
+        """
+        Loads multiple configuration files, concurrently when there are enough to benefit.
+
+        Expected load errors (`OSError` and OmegaConf errors) are returned in place of the loaded
+        configuration so that callers can handle them in a deterministic order.
+        """
+        from omegaconf.errors import OmegaConfBaseException
+
+        def load(path: Path) -> Any:
+            try:
+                return self._load_config_file(path)
+            except (OSError, OmegaConfBaseException) as exc:
+                return exc
+
+        if len(paths) < _CONCURRENT_LOAD_THRESHOLD:
+            return {path: load(path) for path in paths}
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        # NOTE: File reads release the GIL, parsing does not, gains are limited to the I/O
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            return dict(zip(paths, executor.map(load, paths)))
+
+
+def _import_pipeline_function(module_name: str, func_name: str) -> PipelineFunction:
+    """Imports a pipeline creation function by name (cached per composer by the caller)."""
+    from importlib import import_module
+
+    module = import_module(module_name)
+    create_pipelines_func = getattr(module, func_name, None)
+    if create_pipelines_func is None:  # pragma: no cover
+        raise ValueError(f"Function '{func_name}' not found in module '{module_name}'")
+    return create_pipelines_func
+
+
+def _freeze_config(value: Any) -> tuple:
+    """
+    Converts a plain configuration into a hashable key that preserves the type of every value.
+
+    Raises:
+        TypeError: If the configuration contains anything other than dictionaries, lists, tuples
+            and scalars (strings, numbers, booleans, bytes and None).
+    """
+    if isinstance(value, dict):
+        items = frozenset((_freeze_config(k), _freeze_config(v)) for k, v in value.items())
+        return (type(value), items)
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze_config(item) for item in value))
+    if isinstance(value, _FREEZABLE_SCALARS):
+        return (type(value), value)
+    raise TypeError(f"Unsupported configuration value of type '{type(value).__name__}'")
+
+
+def _resolve_config_path(
+    cwd: str,
+    initial_path: str,
+    search_git_root: bool,
+    search_recursive: bool,
+) -> Path:
+    """
+    Resolves a configuration path to an absolute path.
+
+    Absolute paths and paths in the working directory are always checked. Only the search of the
+    git root and parent directories is cached (per working directory and search options), a cached
+    location that no longer exists is searched for again. Use
+    `HamiltonComposer.clear_config_cache` if a configuration path is created in a parent directory
+    that takes precedence over the cached one during the process lifetime.
+    """
+    path = Path(initial_path)
+
+    if path.is_absolute():
+        if not path.exists():
+            raise FileNotFoundError(f"Configuration path '{path}' does not exist.")
+        return path.resolve()
+
+    local_path = Path(cwd).joinpath(path)
+    if local_path.exists():
+        return local_path.resolve()
+
+    path = _search_config_path(cwd, initial_path, search_git_root, search_recursive)
+    if not path.exists():
+        # NOTE: `lru_cache` cannot evict a single entry, stale locations should be rare
+        _search_config_path.cache_clear()
+        path = _search_config_path(cwd, initial_path, search_git_root, search_recursive)
+    return path
+
+
+@lru_cache(maxsize=32)
+def _search_config_path(
+    cwd: str,
+    initial_path: str,
+    search_git_root: bool,
+    search_recursive: bool,
+) -> Path:
+    """Searches the git root and parent directories for a relative configuration path."""
+    path = Path(initial_path)
+    cwd_path = Path(cwd)
+
+    # NOTE: Both search options share a single upward walk from the working directory. A match
+    #       found by the recursive search is held back until the git root has been checked so that
+    #       the precedence stays: working directory, git root, nearest parent directory.
+    fallback_path: Path | None = None
+    if search_git_root and cwd_path.joinpath(".git").exists():
+        search_git_root = False  # The working directory is the git root, already checked above
+    for current_dir in cwd_path.parents:
+        if not (search_git_root or (search_recursive and fallback_path is None)):
+            break
+        is_git_root = search_git_root and current_dir.joinpath(".git").exists()
+        # NOTE: The recursive search stops before the filesystem root, the git root may be anywhere
+        is_searched = (
+            search_recursive and fallback_path is None and current_dir != current_dir.parent
+        )
+        if is_git_root or is_searched:
+            candidate_path = current_dir.joinpath(path)
+            if candidate_path.exists():
+                if is_git_root or not search_git_root:
+                    return candidate_path.resolve()
+                fallback_path = candidate_path
+        if is_git_root:
+            search_git_root = False
+
+    if fallback_path is not None:
+        return fallback_path.resolve()
+
+    raise FileNotFoundError(
+        f"Configuration path '{path}' not found in the current working directory or git root. "
+        f"Consider using an absolute path."
+    )
+
+
+def _overrides_from_dotlist(dotlist: list[str]) -> DictConfig:
+    """
+    Creates the overrides configuration from a dotlist.
+
+    Simple overrides are assembled into a nested dictionary directly, skipping the per-key grammar
+    parsing of `OmegaConf.from_dotlist` (which remains the fallback for everything else). Values
+    are parsed with the same YAML loader used by OmegaConf so that they are typed identically.
+    """
+    from omegaconf import OmegaConf
+
+    loader = _get_omegaconf_yaml_loader()
+    if loader is None or not all(_SIMPLE_OVERRIDE.match(item) for item in dotlist):
+        return OmegaConf.from_dotlist(dotlist)
+
+    import yaml
+
+    nested: dict[str, Any] = {}
+    for item in dotlist:
+        key, value = item.split("=", 1)
+        *parents, leaf = key.split(".")
+        node = nested
+        for part in parents:
+            child = node.setdefault(part, {})
+            if not isinstance(child, dict):  # Conflicting overrides, let OmegaConf decide
+                return OmegaConf.from_dotlist(dotlist)
+            node = child
+        node[leaf] = yaml.load(value, Loader=loader)
+    return OmegaConf.create(nested)
+
+
+@lru_cache(maxsize=1)
+def _get_omegaconf_yaml_loader() -> Any:
+    """Returns the YAML loader OmegaConf uses for dotlist values, or None if it is unavailable."""
+    from importlib import import_module
+
+    # NOTE: The loader is private to OmegaConf and its location differs between versions
+    for module_name in ("omegaconf._yaml", "omegaconf._utils"):
+        try:
+            get_yaml_loader = getattr(import_module(module_name), "get_yaml_loader", None)
+        except ImportError:  # pragma: no cover
+            continue
+        if get_yaml_loader is not None:
+            return get_yaml_loader()
+    return None  # pragma: no cover
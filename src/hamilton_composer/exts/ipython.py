@@ -1,8 +1,5 @@
 from typing import TYPE_CHECKING, Any
 
-from IPython.terminal.embed import InteractiveShellEmbed
-from IPython.terminal.ipapp import load_default_config
-
 if TYPE_CHECKING:
     from hamilton_composer.pipeline import Pipeline
 else:
@@ -11,6 +8,8 @@ else:
 
 def launch_shell(config: dict[str, Any], pipelines: dict[str, Pipeline]) -> None:
     """Launches an ipython shell pre-loaded with Hamilton Composer configuration and pipelines."""
+    from IPython.terminal.embed import InteractiveShellEmbed
+    from IPython.terminal.ipapp import load_default_config
     from rich import get_console
 
     ipython_config = load_default_config()
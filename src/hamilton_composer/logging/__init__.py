@@ -1,27 +1,38 @@
 import logging
-import logging.config
 import time
-from importlib.resources import files
-from itertools import chain
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Final
 
-import yaml
 from typing_extensions import override
 
 PACKAGE_LOGGER_NAME: Final[str] = "hamilton_composer"
 DEFAULT_LOGGERS: Final[tuple[str, ...]] = (PACKAGE_LOGGER_NAME, "hamilton.plugins.h_logging")
 
+# Log file and logger names of the last default configuration applied by `configure_logging`
+_last_config_signature: tuple[str | None, tuple[str, ...]] | None = None
+
+# Handlers installed on each logger by the last default configuration applied by `configure_logging`
+_last_config_handlers: dict[str, list[logging.Handler]] = {}
+
 
 class MillisecondFormatter(logging.Formatter):
     """Formatter that adds milliseconds to the log timestamp."""
 
+    # The formatted timestamp only changes once per second, it is cached for the latest second.
+    # NOTE: The second and its text are stored (and replaced) together, a single attribute
+    #       assignment is atomic, so formatters shared between handlers never mix up the two.
+    _cached: tuple[int, str] = (-1, "")
+
     @override
     def formatTime(self, record, datefmt=None):
-        ct = self.converter(record.created)
-        t = time.strftime("%Y-%m-%d %H:%M:%S", ct)
-        s = "%s.%03d" % (t, record.msecs)
-        return s
+        second = int(record.created)
+        cached_second, cached_time = self._cached
+        if second != cached_second:
+            cached_time = time.strftime("%Y-%m-%d %H:%M:%S", self.converter(record.created))
+            self._cached = (second, cached_time)
+        return f"{cached_time}.{int(record.msecs):03d}"
 
 
 def get_default_logger() -> logging.Logger:
@@ -57,35 +68,79 @@ def configure_logging(
             argument.
         debug (bool, optional):
             If True, sets the logger level for all default and manually specified loggers.
+
+    Note:
+        Repeated calls that only differ in `debug` update the logger levels in place instead of
+        rebuilding the whole logging configuration, as long as the loggers still use the handlers
+        installed by the previous call (i.e. logging was not reconfigured elsewhere).
     """
+    # NOTE: Imported here to keep this module off the CLI start up path (i.e. `--help`)
+    import logging.config
+
+    global _last_config_signature, _last_config_handlers
+
     # Manual configuration should be returned as-is
     if config:
+        _last_config_signature = None
         logging.config.dictConfig(config)
         return
 
     level = "DEBUG" if debug else "INFO"
-    default_loggers = DEFAULT_LOGGERS if include_defaults else []
     handlers = ["console"]
 
-    path = files("hamilton_composer.logging").joinpath("default.yaml")
-    with path.open("r", encoding="utf-8") as f:
-        content = f.read()
-    config = yaml.safe_load(content)
-    assert isinstance(config, dict), "Logging configuration must be a dictionary"
-    assert "handlers" in config, "Internal logging configuration must include 'handlers'"
-    assert "loggers" in config, "Internal logging configuration must include 'loggers'"
+    log_file = str(log_file.resolve()) if isinstance(log_file, Path) else log_file
+    names = tuple(
+        logger.name if isinstance(logger, logging.Logger) else logger
+        for logger in ((*DEFAULT_LOGGERS, *loggers) if include_defaults else loggers)
+    )
+    signature = (log_file, names)
+    if signature == _last_config_signature and _handlers_unchanged(names):
+        for name in names:
+            logging.getLogger(name).setLevel(level)
+        return
+
+    # The cached default configuration is shared, modifications must be made to a copy
+    config = deepcopy(_load_default_config())
 
     # NOTE: We need to determine if the rotating file handler should be included, when not
     # specified by the user it should be removed from the logger configuration.
-    log_file = str(log_file.resolve()) if isinstance(log_file, Path) else log_file
     if log_file:
         config["handlers"]["rotating_file"]["filename"] = log_file
         handlers.append("rotating_file")
     else:
         config["handlers"].pop("rotating_file")
 
-    for logger in chain(default_loggers, loggers):
-        name = logger.name if isinstance(logger, logging.Logger) else logger
-        config["loggers"][name] = {"level": level, "handlers": handlers, "propagate": False}
+    # NOTE: `dictConfig` does not modify the logger configurations, they can share a single dict
+    logger_config = {"level": level, "handlers": handlers, "propagate": False}
+    config["loggers"].update(dict.fromkeys(names, logger_config))
 
     logging.config.dictConfig(config)
+    _last_config_signature = signature
+    _last_config_handlers = {name: list(logging.getLogger(name).handlers) for name in names}
+
+
+def _handlers_unchanged(names: tuple[str, ...]) -> bool:
+    """Checks that the loggers are still configured as `configure_logging` last left them."""
+    for name in names:
+        logger = logging.getLogger(name)
+        if logger.disabled or logger.handlers != _last_config_handlers.get(name):
+            return False
+    return True
+
+
+@lru_cache(maxsize=1)
+def _load_default_config() -> dict[str, Any]:
+    """Loads (once) the internal default logging configuration from `default.yaml`."""
+    # NOTE: Imported here to keep these modules off the CLI start up path (i.e. `--help`)
+    from importlib.resources import files
+
+    import yaml
+
+    path = files("hamilton_composer.logging").joinpath("default.yaml")
+    with path.open("r", encoding="utf-8") as f:
+        content = f.read()
+    config = yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    assert isinstance(config, dict), "Logging configuration must be a dictionary"
+    assert "handlers" in config, "Internal logging configuration must include 'handlers'"
+    assert "loggers" in config, "Internal logging configuration must include 'loggers'"
+    return config
@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING, Any, Callable, Iterable
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
 
 if TYPE_CHECKING:
     from hamilton.driver import Builder
@@ -11,6 +13,9 @@ else:
     HamiltonNode = object
     LifecycleAdapter = object
 
+# Maximum number of drivers (one per distinct set of adapters) kept by each pipeline
+_DRIVER_CACHE_SIZE = 8
+
 
 class Pipeline:
     """
@@ -28,7 +33,7 @@ class Pipeline:
             For more information on the Hamilton `Builder` class, see the following
             - https://hamilton.dagworks.io/en/latest/concepts/builder/
             - https://hamilton.dagworks.io/en/latest/reference/drivers/Driver/#hamilton.driver.Builder
-        final_vars (list[str | Callable | hamilton.graph_types.HamiltonNode]):
+        final_vars (list[str | Callable | hamilton.graph_types.HamiltonNode] | tuple[...]):
             Final variables that the driver will compute. These can be strings representing node
             names, callable functions, or HamiltonNode instances.
         config (dict[str, Any], optional):
@@ -52,43 +57,75 @@ class Pipeline:
         >>> results = pipeline.execute(inputs={"input_param": 42})
     """
 
+    __slots__ = ("_builder", "_final_vars", "description", "tags", "_public", "_driver_cache")
+
     def __init__(
         self,
         builder: Builder,
-        final_vars: list[str | Callable | HamiltonNode],
+        final_vars: list[str | Callable | HamiltonNode] | tuple[str | Callable | HamiltonNode, ...],
         *,
         description: str | None = None,
         tags: Iterable[str] | None = None,
         public: bool = True,
     ) -> None:
-        if not builder or not isinstance(builder, Builder):
+        if not isinstance(builder, _get_builder_cls()):
             name = type(builder).__name__
             raise TypeError(f"Expected 'builder' to be a Hamilton Builder instance, got {name}.")
         self._builder = builder
-        if not isinstance(final_vars, list):
-            raise TypeError(f"Expected 'final_vars' to be a list instance, got {final_vars}.")
-        self._final_vars = final_vars
+        if not isinstance(final_vars, (list, tuple)):
+            raise TypeError(
+                f"Expected 'final_vars' to be a list or tuple instance, got {final_vars}."
+            )
+        # NOTE: Node names are interned, Hamilton repeatedly uses them for lookups and comparisons
+        self._final_vars = tuple(
+            sys.intern(var) if isinstance(var, str) else var for var in final_vars
+        )
         self.description = description
-        self.tags = tags if tags is not None else []
+        self.tags: tuple[str, ...] = tuple(tags) if tags is not None else ()
         self._public = public
+        self._driver_cache: dict[
+            tuple[int, ...], tuple[tuple[LifecycleAdapter, ...], Driver, frozenset[str]]
+        ] = {}
 
     @property
     def public(self) -> bool:
         """Returns whether this pipeline is considered public."""
         return self._public
 
-    def _build_driver(self, adapters: Iterable[LifecycleAdapter] | None = None) -> Driver:
-        """Builds the driver with optionally configuration and adapters."""
-        intermediate = self._builder.with_adapters(*adapters) if adapters else self._builder
-        return intermediate.build()
+    def _build_driver(
+        self, adapters: Iterable[LifecycleAdapter] | None = None
+    ) -> tuple[Driver, frozenset[str]]:
+        """
+        Builds the driver with optionally configuration and adapters.
+
+        Drivers are cached (least recently used) by the identity of the adapters, repeated calls
+        with the same adapters, or none at all, reuse the driver instead of rebuilding the DAG. The
+        driver is returned alongside the (precomputed) keys of its configuration.
+        """
+        adapters = tuple(adapters) if adapters else ()
+        key = tuple(id(adapter) for adapter in adapters)
+        cached = self._driver_cache.pop(key, None)
+        if cached is None:
+            # NOTE: `Builder.with_adapters` modifies the builder in place, extend a copy instead
+            builder = self._builder.copy().with_adapters(*adapters) if adapters else self._builder
+            driver = builder.build()
+            # NOTE: Adapters are kept so that their ids are not reused while cached
+            cached = (adapters, driver, frozenset(driver.config))
+            if len(self._driver_cache) >= _DRIVER_CACHE_SIZE:
+                del self._driver_cache[next(iter(self._driver_cache))]
+        self._driver_cache[key] = cached
+        return cached[1], cached[2]
 
     def _process_inputs(
-        self, driver: Driver, inputs: dict[str, Any] | None
+        self, config_keys: frozenset[str], inputs: dict[str, Any] | None
     ) -> dict[str, Any] | None:
         """Processes inputs key-value pairs that were previously passed to driver configuration."""
         if not inputs:
             return None
-        return {key: value for key, value in inputs.items() if key not in driver.config}
+        if not config_keys or config_keys.isdisjoint(inputs):
+            return inputs  # Nothing to filter, the common case does not need a copy
+        # NOTE: Set difference of the keys avoids a Python level membership test per key
+        return {key: inputs[key] for key in inputs.keys() - config_keys}
 
     def execute(
         self,
@@ -108,8 +145,8 @@ class Pipeline:
                 Additional lifecycle adapters to apply to the execution. These can be used to
                 customize the execution behavior, such as logging or monitoring.
         """
-        driver = self._build_driver(adapters)
-        inputs = self._process_inputs(driver, inputs)
+        driver, config_keys = self._build_driver(adapters)
+        inputs = self._process_inputs(config_keys, inputs)
         result = driver.execute(
             final_vars=self._final_vars,
             overrides=overrides,  # pyright: ignore[reportArgumentType]
@@ -117,6 +154,36 @@ class Pipeline:
         )
         return result
 
+    def execute_many(
+        self,
+        inputs: Iterable[dict[str, Any] | None],
+        overrides: dict[str, Any] | None = None,
+        adapters: Iterable[LifecycleAdapter] | None = None,
+    ) -> Iterator[Any]:
+        """
+        Executes the Hamilton driver once for each set of inputs, yielding results as they complete.
+
+        The driver is built (or retrieved from the cache) once before the first execution, making
+        this preferable to repeatedly calling `execute` when streaming many inputs.
+
+        Args:
+            inputs (Iterable[dict[str, Any] | None]):
+                Inputs for each execution of the pipeline. Consumed lazily, one per execution.
+            overrides (dict[str, Any], optional):
+                Node overrides for every execution - will replace nodes with precomputed values.
+            adapters (Iterable[LifecycleAdapter], optional):
+                Additional lifecycle adapters to apply to the executions. These can be used to
+                customize the execution behavior, such as logging or monitoring.
+        """
+        driver, config_keys = self._build_driver(adapters)
+        final_vars = self._final_vars
+        for execution_inputs in inputs:
+            yield driver.execute(
+                final_vars=final_vars,
+                overrides=overrides,  # pyright: ignore[reportArgumentType]
+                inputs=self._process_inputs(config_keys, execution_inputs),  # pyright: ignore[reportArgumentType]
+            )
+
     def export_execution(
         self,
         inputs: dict[str, Any] | None = None,
@@ -138,8 +205,8 @@ class Pipeline:
         Returns:
             str: The exported execution result as a string.
         """
-        driver = self._build_driver(adapters)
-        inputs = self._process_inputs(driver, inputs)
+        driver, config_keys = self._build_driver(adapters)
+        inputs = self._process_inputs(config_keys, inputs)
         return driver.export_execution(
             final_vars=self._final_vars,
             inputs=inputs,
@@ -164,8 +231,8 @@ class Pipeline:
                 Additional lifecycle adapters to apply to the execution. These can be used to
                 customize the execution behavior, such as logging or monitoring.
         """
-        driver = self._build_driver(adapters)
-        inputs = self._process_inputs(driver, inputs)
+        driver, config_keys = self._build_driver(adapters)
+        inputs = self._process_inputs(config_keys, inputs)
         driver.validate_execution(
             final_vars=self._final_vars,
             overrides=overrides,  # pyright: ignore[reportArgumentType]
@@ -194,8 +261,8 @@ class Pipeline:
         See the `hamilton.driver.Driver.visualize_execution` method for details on the parameters:
         - https://hamilton.dagworks.io/en/latest/reference/drivers/Driver/
         """
-        driver = self._build_driver()
-        inputs = self._process_inputs(driver, inputs)
+        driver, config_keys = self._build_driver()
+        inputs = self._process_inputs(config_keys, inputs)
         return driver.visualize_execution(
             final_vars=self._final_vars,
             output_file_path=output_file_path,
@@ -212,3 +279,12 @@ class Pipeline:
             bypass_validation=bypass_validation,
             keep_dot=keep_dot,
         )
+
+
+@lru_cache(maxsize=1)
+def _get_builder_cls() -> type[Builder]:
+    """Returns (once) the Hamilton `Builder` class used to validate pipeline builders."""
+    # NOTE: Imported here to keep hamilton off the import path of this module
+    from hamilton.driver import Builder
+
+    return Builder
@@ -1,34 +1,61 @@
-import subprocess
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal, overload
 
 
 @overload
-def get_git_root(raise_error: Literal[False]) -> Path | None: ...
+def get_git_root(raise_error: Literal[False], cwd: str | Path | None = None) -> Path | None: ...
 
 
 @overload
-def get_git_root(raise_error: Literal[True]) -> Path: ...
+def get_git_root(raise_error: Literal[True], cwd: str | Path | None = None) -> Path: ...
 
 
 @overload
-def get_git_root() -> Path: ...
+def get_git_root(*, cwd: str | Path | None = None) -> Path: ...
 
 
-def get_git_root(raise_error: bool = True) -> Path | None:
+@overload
+def get_git_root(raise_error: bool, cwd: str | Path | None = None) -> Path | None: ...
+
+
+def get_git_root(raise_error: bool = True, cwd: str | Path | None = None) -> Path | None:
     """
     Finds the root directory of a git repository.
 
+    The search walks up from the starting directory looking for a `.git` entry (either a
+    directory or, for worktrees and submodules, a file) without spawning a `git` subprocess.
+    Results are cached per starting directory and symbolic links are resolved (i.e. a macOS
+    `/var/...` directory is reported under `/private/var/...`).
+
     Args:
         raise_error: Whether to raise an error if not in a git repository.
+        cwd: Directory to start the search from, defaults to the current working directory.
 
     Returns:
-        The root directory of the git repository, or None (only if raise_error is False).
+        The resolved root directory of the git repository, or None (only if raise_error is False).
     """
-    try:
-        response = subprocess.check_output(["git", "rev-parse", "--show-toplevel"], text=True)
-        return Path(response.strip())
-    except subprocess.CalledProcessError:
-        if raise_error:
-            raise RuntimeError("Not in a git repository") from None
-    return None
+    root = _find_git_root(os.getcwd() if cwd is None else os.path.abspath(cwd))
+    if root is None and raise_error:
+        raise RuntimeError("Not in a git repository")
+    return root
+
+
+def clear_git_root_cache() -> None:
+    """Clears the cache of git root directories found by `get_git_root`."""
+    _find_git_root.cache_clear()
+
+
+@lru_cache(maxsize=32)
+def _find_git_root(cwd: str) -> Path | None:
+    """Walks up from `cwd` looking for the closest directory containing a `.git` entry."""
+    # NOTE: Resolved here, rather than by the caller, so that the resolution is cached as well
+    current = os.path.realpath(cwd)
+    while True:
+        if os.path.exists(os.path.join(current, ".git")):
+            return Path(current)
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
@@ -1,4 +1,3 @@
-import os
 from dataclasses import dataclass
 
 from hamilton_composer import HamiltonComposer
@@ -35,13 +34,72 @@ class TestPipelineExecutionWithoutConfig:
         result = pipelines["branched_pipeline"].execute(inputs={"numbers": [2, 4, 6], "factor": 2})
         assert result["transformed_sum"] == 48
 
+    def test_find_pipelines_is_not_cached_by_default(self, mocker):
+        """Test pipelines are created on every call unless caching was requested."""
+        from ..defs import pipelines as module
+
+        create_pipelines = mocker.Mock(wraps=module.create_pipelines)
+        composer = HamiltonComposer(create_pipelines)
+
+        first = composer.find_pipelines({"method": "multiply"})
+        second = composer.find_pipelines({"method": "multiply"})
+        assert create_pipelines.call_count == 2
+        assert first["simple_pipeline"] is not second["simple_pipeline"]
+
+    def test_find_pipelines_is_cached_per_config(self, mocker):
+        """Test pipelines are only created once for equal configurations when caching."""
+        from ..defs import pipelines as module
+
+        create_pipelines = mocker.Mock(wraps=module.create_pipelines)
+        composer = HamiltonComposer(create_pipelines, cache_pipelines=True)
+
+        first = composer.find_pipelines({"method": "multiply", "extra": [1]})
+        second = composer.find_pipelines({"extra": [1], "method": "multiply"})
+        assert create_pipelines.call_count == 1
+        assert first == second and first is not second
+
+        composer.find_pipelines({"method": "add"})
+        composer.find_pipelines(SimpleSchema(numbers=[1]))
+        composer.find_pipelines(SimpleSchema(numbers=[1]))
+        assert create_pipelines.call_count == 4
+
+    def test_find_pipelines_imports_current_function(self, mocker, monkeypatch):
+        """Test new composers use the current pipeline function (i.e. after a module reload)."""
+        from ..defs import pipelines as module
+
+        HamiltonComposer("tests.defs.pipelines.create_pipelines").find_pipelines()
+
+        replacement = mocker.Mock(return_value={})
+        monkeypatch.setattr(module, "create_pipelines", replacement)
+        assert HamiltonComposer("tests.defs.pipelines.create_pipelines").find_pipelines() == {}
+        replacement.assert_called_once()
+
+    def test_find_pipelines_cache_preserves_types(self, mocker):
+        """Test configurations that only differ in key or value types are cached separately."""
+        create_pipelines = mocker.Mock(return_value={})
+        composer = HamiltonComposer(create_pipelines, cache_pipelines=True)
+
+        for config in ({1: "a"}, {"1": "a"}, {"x": [1]}, {"x": (1,)}, {"x": 1}, {"x": True}):
+            composer.find_pipelines(config)
+        assert create_pipelines.call_count == 6
+
+    def test_find_pipelines_cache_is_cleared_with_config_cache(self, mocker):
+        """Test `clear_config_cache` also discards cached pipelines."""
+        create_pipelines = mocker.Mock(return_value={})
+        composer = HamiltonComposer(create_pipelines, cache_pipelines=True)
+
+        composer.find_pipelines({"method": "add"})
+        HamiltonComposer.clear_config_cache()
+        composer.find_pipelines({"method": "add"})
+        assert create_pipelines.call_count == 2
+
 
 class TestPipelineExecutionWithConfig:
     """Test pipeline execution with configuration files."""
 
-    def test_execution_with_config_path(self, tmp_path):
+    def test_execution_with_config_path(self, tmp_path, monkeypatch):
         """Test pipeline execution with YAML config file."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         config_path = tmp_path / "config.yaml"
         config_path.write_text("numbers: [1, 2, 3]")
 
@@ -53,10 +111,10 @@ class TestPipelineExecutionWithConfig:
         result = pipelines["simple_pipeline"].execute(inputs=config)
         assert result == {"sum_doubled": 12}
 
-    def test_execution_with_config_directory(self, tmp_path):
+    def test_execution_with_config_directory(self, tmp_path, monkeypatch):
         """Test pipeline execution with configuration directory."""
 
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         config_dir = tmp_path / "config"
         config_dir.mkdir()
         (config_dir / "numbers.yaml").write_text("[1, 2, 3]")
@@ -69,9 +127,9 @@ class TestPipelineExecutionWithConfig:
         result = pipelines["simple_pipeline"].execute(inputs=config)
         assert result == {"sum_doubled": 12}
 
-    def test_execution_with_runtime_config_override(self, tmp_path):
+    def test_execution_with_runtime_config_override(self, tmp_path, monkeypatch):
         """Test execution with runtime config file override."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
 
         config_path1 = tmp_path / "config1.yaml"
         config_path1.write_text("numbers: [1, 2, 3]")
@@ -89,9 +147,9 @@ class TestPipelineExecutionWithConfig:
         result = pipelines["simple_pipeline"].execute(inputs=config)
         assert result == {"sum_doubled": 18}  # 2*2 + 2*3 + 2*4 = 18
 
-    def test_execution_with_schema_validation(self, tmp_path):
+    def test_execution_with_schema_validation(self, tmp_path, monkeypatch):
         """Test pipeline execution with schema validation."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         config_path = tmp_path / "config.yaml"
         config_path.write_text("numbers: [2, 4, 6]")
 
@@ -103,9 +161,9 @@ class TestPipelineExecutionWithConfig:
         result = pipelines["simple_pipeline"].execute(inputs=config)
         assert result == {"sum_doubled": 24}
 
-    def test_execution_with_node_branching_config(self, tmp_path):
+    def test_execution_with_node_branching_config(self, tmp_path, monkeypatch):
         """Test pipeline execution with node-specific branching."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         config_path = tmp_path / "config.yaml"
         config_path.write_text("numbers: [1, 2, 3]\nmethod: add\nfactor: 2")
 
@@ -1,10 +1,14 @@
-import os
 from dataclasses import dataclass
 
 import pytest
 
 from hamilton_composer.composer import HamiltonComposer
 
+# Configuration file contents shared by several tests (encoded once)
+NUMBERS_123_YAML = b"numbers: [1, 2, 3]"
+NUMBERS_456_YAML = b"numbers: [4, 5, 6]"
+KEY_YAML = b"key: test_value"
+
 
 @dataclass
 class SimpleSchema:
@@ -54,11 +58,11 @@ class TestComposerInitialization:
 class TestComposerConfigLoading:
     """Test configuration loading functionality."""
 
-    def test_load_config_from_file(self, tmp_path):
+    def test_load_config_from_file(self, tmp_path, monkeypatch):
         """Test loading configuration from YAML file."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         config_path = tmp_path / "config.yaml"
-        config_path.write_text("numbers: [1, 2, 3]")
+        config_path.write_bytes(NUMBERS_123_YAML)
 
         composer = HamiltonComposer(
             "tests.defs.pipelines.create_pipelines", config_path=config_path
@@ -70,9 +74,9 @@ class TestComposerConfigLoading:
         pipelines = composer.find_pipelines(config)
         assert set(pipelines) == {"simple_pipeline", "branched_pipeline"}
 
-    def test_load_config_path_not_found(self, tmp_path):
+    def test_load_config_path_not_found(self, tmp_path, monkeypatch):
         """Test error when config file doesn't exist."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         config_path = tmp_path / "nonexistent.yaml"
 
         composer = HamiltonComposer(
@@ -82,11 +86,11 @@ class TestComposerConfigLoading:
         with pytest.raises(FileNotFoundError):
             composer.load_config()
 
-    def test_load_config_with_parameters_override(self, tmp_path):
+    def test_load_config_with_parameters_override(self, tmp_path, monkeypatch):
         """Test loading config with parameter overrides."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         config_path = tmp_path / "config.yaml"
-        config_path.write_text("numbers: [1, 2, 3]")
+        config_path.write_bytes(NUMBERS_123_YAML)
 
         composer = HamiltonComposer(
             "tests.defs.pipelines.create_pipelines", config_path=config_path
@@ -95,10 +99,92 @@ class TestComposerConfigLoading:
         config = composer.load_config(params=["numbers=[4,5,6]"])
         assert config == {"numbers": [4, 5, 6]}
 
-    def test_load_config_from_directory(self, tmp_path):
+    def test_load_config_reuses_unchanged_files(self, tmp_path, mocker):
+        """Test unchanged configuration files are only parsed once."""
+        from omegaconf import OmegaConf
+
+        config_path = tmp_path / "config.yaml"
+        config_path.write_bytes(NUMBERS_123_YAML)
+        load = mocker.spy(OmegaConf, "load")
+
+        composer = HamiltonComposer(
+            "tests.defs.pipelines.create_pipelines", config_path=config_path
+        )
+
+        assert composer.load_config(params=["extra=1"]) == {"numbers": [1, 2, 3], "extra": 1}
+        assert composer.load_config() == {"numbers": [1, 2, 3]}
+        assert load.call_count == 1
+
+        other_composer = HamiltonComposer(
+            "tests.defs.pipelines.create_pipelines", config_path=config_path
+        )
+        assert other_composer.load_config() == {"numbers": [1, 2, 3]}
+        assert load.call_count == 1
+
+        HamiltonComposer.clear_config_cache()
+        assert composer.load_config() == {"numbers": [1, 2, 3]}
+        assert load.call_count == 2
+
+        config_path.write_text("numbers: [4, 5, 6, 7]")
+        assert composer.load_config() == {"numbers": [4, 5, 6, 7]}
+        assert load.call_count == 3
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            ["a.b=1", "a.c=1.5e3", "flag=true", "name=text", "empty=", "a.d='quoted'"],
+            ["a=1", "a=2", "b.c=3", "b=4"],
+            ["a.b=1", "items=[1,2]", "ref=${a.b}"],
+        ],
+    )
+    def test_load_config_parameters_match_dotlist(self, params):
+        """Test parameter overrides are typed exactly as `OmegaConf.from_dotlist` would."""
+        from omegaconf import OmegaConf
+
+        composer = HamiltonComposer("tests.defs.pipelines.create_pipelines")
+
+        expected = OmegaConf.to_container(OmegaConf.from_dotlist(params), resolve=True)
+        assert composer.load_config(params=params) == expected
+
+    def test_load_config_raw(self, tmp_path, monkeypatch):
+        """Test loading an unresolved configuration."""
+        from omegaconf import DictConfig
+        from omegaconf import OmegaConf
+
+        monkeypatch.chdir(tmp_path)
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("numbers: [1, 2, 3]\nfirst: ${numbers[0]}")
+
+        composer = HamiltonComposer(
+            "tests.defs.pipelines.create_pipelines", config_path=config_path
+        )
+
+        config = composer.load_config(params=["method=add"], raw=True)
+        assert isinstance(config, DictConfig)
+        assert OmegaConf.to_container(config)["first"] == "${numbers[0]}"  # pyright: ignore
+        assert config.first == 1
+        assert config.method == "add"
+
+        pipelines = composer.find_pipelines(config)
+        assert set(pipelines) == {"simple_pipeline", "branched_pipeline"}
+
+    def test_load_config_raw_is_independent(self, tmp_path):
+        """Test that modifying an unresolved configuration does not affect later loads."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_bytes(NUMBERS_123_YAML)
+
+        composer = HamiltonComposer(
+            "tests.defs.pipelines.create_pipelines", config_path=config_path
+        )
+
+        config = composer.load_config(raw=True)
+        config.numbers = [4, 5, 6]  # pyright: ignore
+        assert composer.load_config() == {"numbers": [1, 2, 3]}
+
+    def test_load_config_from_directory(self, tmp_path, monkeypatch):
         """Test loading configuration from a directory."""
 
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         config_dir = tmp_path / "config"
         config_dir.mkdir()
 
@@ -109,6 +195,7 @@ class TestComposerConfigLoading:
         nested.mkdir()
         (nested / "factor.yaml").write_text("2")
         (nested / "options.yaml").write_text("enabled: true")
+        (config_dir / "scale.yaml").write_text("value: ${branch.factor}")
 
         composer = HamiltonComposer(
             "tests.defs.pipelines.create_pipelines", config_path=config_dir
@@ -119,17 +206,43 @@ class TestComposerConfigLoading:
             "numbers": [1, 2, 3],
             "method": "multiply",
             "branch": {"factor": 2, "options": {"enabled": True}},
+            "scale": {"value": 2},
         }
 
+    def test_load_config_from_large_directory(self, tmp_path):
+        """Test loading a configuration directory with enough files to load concurrently."""
+        import yaml
+
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        for index in range(12):
+            (config_dir / f"item_{index:02d}.yaml").write_text(f"value: {index}")
+        (config_dir / "factor.yaml").write_text("2")
+        (config_dir / "method.yaml").write_text("multiply")
+
+        composer = HamiltonComposer(
+            "tests.defs.pipelines.create_pipelines", config_path=config_dir
+        )
+
+        config = composer.load_config()
+        assert list(config) == sorted(config)
+        assert config["factor"] == 2
+        assert config["method"] == "multiply"
+        assert all(config[f"item_{index:02d}"] == {"value": index} for index in range(12))
+
+        (config_dir / "item_05.yaml").write_text("value: [unclosed")
+        with pytest.raises(yaml.YAMLError):
+            composer.load_config()
+
 
 class TestComposerWithSchema:
     """Test schema validation functionality."""
 
-    def test_schema_validation_success(self, tmp_path):
+    def test_schema_validation_success(self, tmp_path, monkeypatch):
         """Test successful schema validation."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         config_path = tmp_path / "config.yaml"
-        config_path.write_text("key: test_value")
+        config_path.write_bytes(KEY_YAML)
 
         composer = HamiltonComposer(
             "tests.defs.pipelines.create_pipelines", config_path=config_path, schema=SimpleSchema
@@ -138,9 +251,9 @@ class TestComposerWithSchema:
         config = composer.load_config()
         assert config == {"key": "test_value"}
 
-    def test_schema_with_defaults(self, tmp_path):
+    def test_schema_with_defaults(self, tmp_path, monkeypatch):
         """Test schema providing default values."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         config_path = tmp_path / "empty.yaml"
         config_path.write_text("# empty config")
 
@@ -152,6 +265,32 @@ class TestComposerWithSchema:
         config = composer.load_config(params=["key=from_params"])
         assert config == {"key": "from_params"}
 
+    def test_schema_ignores_raw(self, tmp_path, monkeypatch):
+        """Test that structured configs are always materialized."""
+        monkeypatch.chdir(tmp_path)
+        config_path = tmp_path / "config.yaml"
+        config_path.write_bytes(KEY_YAML)
+
+        composer = HamiltonComposer(
+            "tests.defs.pipelines.create_pipelines", config_path=config_path, schema=SimpleSchema
+        )
+
+        config = composer.load_config(raw=True)
+        assert config == {"key": "test_value"}
+
+    def test_schema_defaults_are_not_modified(self, tmp_path, monkeypatch):
+        """Test that repeated loads do not leak values into the schema defaults."""
+        monkeypatch.chdir(tmp_path)
+        config_path = tmp_path / "empty.yaml"
+        config_path.write_text("# empty config")
+
+        composer = HamiltonComposer(
+            "tests.defs.pipelines.create_pipelines", config_path=config_path, schema=SimpleSchema
+        )
+
+        assert composer.load_config(params=["key=first"]) == {"key": "first"}
+        assert composer.load_config(params=["key=second"]) == {"key": "second"}
+
 
 class TestComposerValidation:
     """Test validation and error handling in HamiltonComposer."""
@@ -161,6 +300,12 @@ class TestComposerValidation:
         with pytest.raises(TypeError, match="pipeline_function must be a callable or a string"):
             HamiltonComposer(123)  # pyright: ignore
 
+    @pytest.mark.parametrize("name", ["nodots", ".create_pipelines", "tests.defs.pipelines."])
+    def test_invalid_pipeline_function_name(self, name):
+        """Test error when pipeline_function is not a fully qualified module and function name."""
+        with pytest.raises(TypeError, match="fully qualified name of a module and function"):
+            HamiltonComposer(name)
+
     def test_non_dataclass_schema(self):
         """Test error when schema is not a dataclass."""
 
@@ -181,22 +326,20 @@ class TestComposerValidation:
 class TestComposerConfigResolution:
     """Test configuration file resolution with different search strategies."""
 
-    def test_config_resolution_with_git_search(self, tmp_path):
+    def test_config_resolution_with_git_search(self, tmp_path, fake_git_repo, monkeypatch):
         """Test config file resolution searching in git root."""
-        import subprocess
-
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         # Create git repo structure
-        subprocess.run(["git", "init"], check=True, capture_output=True)
+        fake_git_repo(tmp_path)
 
         # Create config in git root
         config_path = tmp_path / "project_config.yaml"
-        config_path.write_text("numbers: [1, 2, 3]")
+        config_path.write_bytes(NUMBERS_123_YAML)
 
         # Create and move to subdirectory
         subdir = tmp_path / "sub" / "deep"
         subdir.mkdir(parents=True)
-        os.chdir(subdir)
+        monkeypatch.chdir(subdir)
 
         composer = HamiltonComposer(
             "tests.defs.pipelines.create_pipelines", config_path="project_config.yaml"
@@ -205,18 +348,18 @@ class TestComposerConfigResolution:
         config = composer.load_config(search_git_root=True)
         assert config == {"numbers": [1, 2, 3]}
 
-    def test_config_resolution_with_recursive_search(self, tmp_path):
+    def test_config_resolution_with_recursive_search(self, tmp_path, monkeypatch):
         """Test config file resolution with recursive directory search."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
 
         # Create config in parent directory
         config_path = tmp_path / "project_config.yaml"
-        config_path.write_text("numbers: [4, 5, 6]")
+        config_path.write_bytes(NUMBERS_456_YAML)
 
         # Create and move to subdirectory
         subdir = tmp_path / "sub" / "deep"
         subdir.mkdir(parents=True)
-        os.chdir(subdir)
+        monkeypatch.chdir(subdir)
 
         composer = HamiltonComposer(
             "tests.defs.pipelines.create_pipelines", config_path="project_config.yaml"
@@ -225,13 +368,31 @@ class TestComposerConfigResolution:
         config = composer.load_config(search_recursive=True)
         assert config == {"numbers": [4, 5, 6]}
 
-    def test_config_directory_resolution_with_search(self, tmp_path):
-        """Test resolving configuration directories with search options."""
+    def test_config_resolution_prefers_git_root_over_parents(
+        self, tmp_path, fake_git_repo, monkeypatch
+    ):
+        """Test the git root takes precedence over nearer parents when searching both."""
+        monkeypatch.chdir(tmp_path)
+        fake_git_repo(tmp_path)
+        (tmp_path / "project_config.yaml").write_bytes(NUMBERS_123_YAML)
+
+        subdir = tmp_path / "sub" / "deep"
+        subdir.mkdir(parents=True)
+        (tmp_path / "sub" / "project_config.yaml").write_bytes(NUMBERS_456_YAML)
+        monkeypatch.chdir(subdir)
+
+        composer = HamiltonComposer(
+            "tests.defs.pipelines.create_pipelines", config_path="project_config.yaml"
+        )
 
-        import subprocess
+        config = composer.load_config(search_git_root=True, search_recursive=True)
+        assert config == {"numbers": [1, 2, 3]}
+
+    def test_config_directory_resolution_with_search(self, tmp_path, fake_git_repo, monkeypatch):
+        """Test resolving configuration directories with search options."""
 
-        os.chdir(tmp_path)
-        subprocess.run(["git", "init"], check=True, capture_output=True)
+        monkeypatch.chdir(tmp_path)
+        fake_git_repo(tmp_path)
 
         config_dir = tmp_path / "config"
         config_dir.mkdir()
@@ -239,7 +400,7 @@ class TestComposerConfigResolution:
 
         subdir = tmp_path / "child"
         subdir.mkdir()
-        os.chdir(subdir)
+        monkeypatch.chdir(subdir)
 
         composer = HamiltonComposer(
             "tests.defs.pipelines.create_pipelines", config_path="config"
@@ -248,9 +409,59 @@ class TestComposerConfigResolution:
         config = composer.load_config(search_git_root=True)
         assert config == {"numbers": [7, 8, 9]}
 
-    def test_config_resolution_fallback_error(self, tmp_path):
+    def test_config_resolution_is_cached(self, tmp_path, monkeypatch):
+        """Test parent directory searches are cached until the cache is cleared."""
+        (tmp_path / "project_config.yaml").write_bytes(NUMBERS_123_YAML)
+        subdir = tmp_path / "sub"
+        workdir = subdir / "work"
+        workdir.mkdir(parents=True)
+        monkeypatch.chdir(workdir)
+
+        composer = HamiltonComposer(
+            "tests.defs.pipelines.create_pipelines", config_path="project_config.yaml"
+        )
+        assert composer.load_config(search_recursive=True) == {"numbers": [1, 2, 3]}
+
+        (subdir / "project_config.yaml").write_bytes(NUMBERS_456_YAML)
+        assert composer.load_config(search_recursive=True) == {"numbers": [1, 2, 3]}
+
+        HamiltonComposer.clear_config_cache()
+        assert composer.load_config(search_recursive=True) == {"numbers": [4, 5, 6]}
+
+    def test_config_resolution_prefers_new_local_path(self, tmp_path, monkeypatch):
+        """Test a config path created in the working directory takes precedence immediately."""
+        (tmp_path / "project_config.yaml").write_bytes(NUMBERS_123_YAML)
+        subdir = tmp_path / "sub"
+        subdir.mkdir()
+        monkeypatch.chdir(subdir)
+
+        composer = HamiltonComposer(
+            "tests.defs.pipelines.create_pipelines", config_path="project_config.yaml"
+        )
+        assert composer.load_config(search_recursive=True) == {"numbers": [1, 2, 3]}
+
+        (subdir / "project_config.yaml").write_bytes(NUMBERS_456_YAML)
+        assert composer.load_config(search_recursive=True) == {"numbers": [4, 5, 6]}
+
+    def test_config_resolution_skips_removed_cached_path(self, tmp_path, monkeypatch):
+        """Test a cached config path that was removed is searched for again."""
+        (tmp_path / "project_config.yaml").write_bytes(NUMBERS_123_YAML)
+        subdir = tmp_path / "sub"
+        subdir.mkdir()
+        (subdir / "project_config.yaml").write_bytes(NUMBERS_456_YAML)
+        monkeypatch.chdir(subdir)
+
+        composer = HamiltonComposer(
+            "tests.defs.pipelines.create_pipelines", config_path="project_config.yaml"
+        )
+        assert composer.load_config(search_recursive=True) == {"numbers": [4, 5, 6]}
+
+        (subdir / "project_config.yaml").unlink()
+        assert composer.load_config(search_recursive=True) == {"numbers": [1, 2, 3]}
+
+    def test_config_resolution_fallback_error(self, tmp_path, monkeypatch):
         """Test error when config file not found with all search options."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
 
         composer = HamiltonComposer(
             "tests.defs.pipelines.create_pipelines", config_path="nonexistent.yaml"
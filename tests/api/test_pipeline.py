@@ -1,98 +1,128 @@
+import json
+
 import pytest
-import yaml
 
 from hamilton_composer.pipeline import Pipeline
 
 
-def A() -> int:
-    return 1
-
-
-def B() -> int:
-    return 2
-
-
-def C() -> int:
-    return 3
+@pytest.fixture(scope="module")
+def builder():
+    """Fixture to provide a Hamilton builder for the A, B, C and D nodes (shared by the module)."""
+    from hamilton.driver import Builder
 
+    from ..defs import nodes
 
-def D(A: int, B: int, C: int, factor: int) -> int:
-    return (A + B + C) * factor
+    return Builder().with_modules(nodes)
 
 
 class TestPipeline:
-    def test_validation_with_valid_pipeline(self) -> None:
+    def test_validation_with_valid_pipeline(self, builder) -> None:
         """Test validation of pipeline inputs and outputs."""
 
-        from hamilton.ad_hoc_utils import create_temporary_module
-        from hamilton.driver import Builder
-
-        module = create_temporary_module(A, B, C, D)
-        builder = Builder().with_modules(module)
-
         pipeline = Pipeline(builder, final_vars=["D"], public=True)
         pipeline.validate_execution(inputs={"factor": 2})
 
-    def test_validation_with_invalid_pipeline(self) -> None:
+    def test_validation_with_invalid_pipeline(self, builder) -> None:
         """Test validation of pipeline inputs and outputs."""
 
-        from hamilton.ad_hoc_utils import create_temporary_module
-        from hamilton.driver import Builder
-
-        module = create_temporary_module(A, B, C, D)
-        builder = Builder().with_modules(module)
-
         pipeline = Pipeline(builder, final_vars=["D"], public=True)
         with pytest.raises(ValueError, match="Required input .* not provided"):
             pipeline.validate_execution()
 
-    def test_export(self) -> None:
+    def test_export(self, builder) -> None:
         """Test exporting a pipeline."""
 
-        from hamilton.ad_hoc_utils import create_temporary_module
-        from hamilton.driver import Builder
-
-        module = create_temporary_module(A, B, C, D)
-        builder = Builder().with_modules(module)
         pipeline = Pipeline(builder, final_vars=["D"], public=True)
 
         exported_pipeline = pipeline.export_execution(inputs={"factor": 2})
         assert exported_pipeline is not None, "Exported pipeline should not be None."
 
-        content = yaml.safe_load(exported_pipeline)
+        content = json.loads(exported_pipeline)
         nodes = {node["name"] for node in content["nodes"]}
         assert nodes == {"A", "B", "C", "D", "factor"}, (
             "Exported pipeline nodes do not match expected nodes."
         )
 
-    def test_visualization(self) -> None:
+    def test_visualization(self, builder) -> None:
         """Test visualization of a pipeline."""
 
-        from graphviz.graphs import Digraph
-        from hamilton.ad_hoc_utils import create_temporary_module
-        from hamilton.driver import Builder
+        Digraph = pytest.importorskip("graphviz.graphs").Digraph
 
-        module = create_temporary_module(A, B, C, D)
-        builder = Builder().with_modules(module)
         pipeline = Pipeline(builder, final_vars=["D"], public=True)
 
         visualization = pipeline.visualize_execution(inputs={"factor": 2})
         assert isinstance(visualization, Digraph), "Visualization should return a Digraph object."
 
+    def test_tags_are_stored_as_tuple(self) -> None:
+        """Test that tags from any iterable are stored as a tuple."""
+
+        from hamilton.driver import Builder
+
+        pipeline = Pipeline(Builder(), final_vars=["D"], tags=(tag for tag in ["a", "b"]))
+        assert pipeline.tags == ("a", "b")
+        assert Pipeline(Builder(), final_vars=["D"]).tags == ()
+
     def test_invalid_builder(self) -> None:
         """Test handling of invalid builder in pipeline."""
 
         with pytest.raises(TypeError, match="to be a Hamilton Builder instance"):
             Pipeline(builder=None, final_vars=["D"], public=True)  # pyright: ignore[reportArgumentType]
 
-    def test_invalid_final_vars(self) -> None:
+        with pytest.raises(TypeError, match="to be a Hamilton Builder instance"):
+            Pipeline(builder=object(), final_vars=["D"], public=True)  # pyright: ignore[reportArgumentType]
+
+    def test_invalid_final_vars(self, builder) -> None:
         """Test handling of invalid final_vars in pipeline."""
 
-        from hamilton.ad_hoc_utils import create_temporary_module
+        with pytest.raises(TypeError, match="to be a list or tuple instance."):
+            Pipeline(builder, final_vars=None, public=True)  # type: ignore
+
+    def test_inputs_in_config_are_ignored(self) -> None:
+        """Test that inputs already provided by the builder configuration are dropped."""
+
         from hamilton.driver import Builder
 
-        module = create_temporary_module(A, B, C, D)
-        builder = Builder().with_modules(module)
+        from ..defs import nodes
 
-        with pytest.raises(TypeError, match="to be a list instance."):
-            Pipeline(builder, final_vars=None, public=True)  # type: ignore
+        builder = Builder().with_modules(nodes).with_config({"factor": 3})
+        pipeline = Pipeline(builder, final_vars=["D"], public=True)
+
+        assert pipeline.execute(inputs={"factor": 2, "unused": 0}) == {"D": 18}
+
+        inputs = {"unused": 0}
+        _, config_keys = pipeline._build_driver()
+        assert config_keys == {"factor"}
+        assert pipeline._process_inputs(config_keys, inputs) is inputs
+
+    def test_execute_many(self, builder, mocker) -> None:
+        """Test that executing many inputs builds the driver once and streams the results."""
+
+        from hamilton.driver import Builder
+
+        pipeline = Pipeline(builder, final_vars=["D"], public=True)
+        spy = mocker.spy(Builder, "build")
+
+        results = pipeline.execute_many({"factor": factor} for factor in range(3))
+        assert spy.call_count == 0, "Executions should not start until results are consumed."
+        assert list(results) == [{"D": 0}, {"D": 6}, {"D": 12}]
+        assert spy.call_count == 1
+
+    def test_driver_is_reused(self, builder, mocker) -> None:
+        """Test that drivers are only rebuilt when the adapters change."""
+
+        from hamilton.driver import Builder
+        from hamilton.lifecycle import PrintLn
+
+        pipeline = Pipeline(builder, final_vars=["D"], public=True)
+        spy = mocker.spy(Builder, "build")
+
+        assert pipeline.execute(inputs={"factor": 2}) == {"D": 12}
+        pipeline.validate_execution(inputs={"factor": 2}, adapters=[])
+        pipeline.visualize_execution(inputs={"factor": 2})
+        assert spy.call_count == 1
+
+        adapter = PrintLn()
+        pipeline.execute(inputs={"factor": 2}, adapters=[adapter])
+        pipeline.execute(inputs={"factor": 2}, adapters=[adapter])
+        assert spy.call_count == 2
+        assert builder.adapters == [], "Adapters should not be added to the original builder."
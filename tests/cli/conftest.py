@@ -1,10 +1,32 @@
 import pytest
 from click.testing import CliRunner
 
+from hamilton_composer.cli.factory import build_cli
+from hamilton_composer.composer import HamiltonComposer
+
+from ..defs.functions import LOGGER_NAME as NODES_LOGGER
+
+
+@pytest.fixture(scope="session")
+def _cli_runner():
+    """Fixture to provide a CLI runner shared by the session."""
+    return CliRunner()
+
 
 @pytest.fixture(scope="function")
-def runner():
-    """Fixture to provide a CLI runner."""
-    _runner = CliRunner()
-    with _runner.isolated_filesystem():
-        yield _runner
+def runner(_cli_runner):
+    """Fixture to provide a CLI runner within an isolated filesystem."""
+    with _cli_runner.isolated_filesystem():
+        yield _cli_runner
+
+
+@pytest.fixture(scope="session")
+def default_composer():
+    """Fixture to provide a HamiltonComposer instance for the test pipelines (without config)."""
+    return HamiltonComposer("tests.defs.pipelines.create_pipelines")
+
+
+@pytest.fixture(scope="session")
+def default_cli(default_composer):
+    """Fixture to provide a CLI instance for the default composer."""
+    return build_cli("test-project", default_composer, logger=NODES_LOGGER)
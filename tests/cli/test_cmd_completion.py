@@ -0,0 +1,71 @@
+import shutil
+import subprocess
+
+import click
+import pytest
+
+from hamilton_composer.cli.factory import build_cli
+
+
+@pytest.fixture(scope="module")
+def cli(default_composer):
+    """Fixture to provide a HamiltonComposer CLI instance with a plugin."""
+
+    @click.command(name="hello")
+    def hello():
+        """Say hello."""
+
+    return build_cli("testing-project", default_composer, plugins=[hello])
+
+
+class TestCompletionCommand:
+    """Test the 'completion' command of the CLI."""
+
+    def test_completion_command_help(self, runner, cli):
+        """Test the help message for the 'completion' command."""
+        result = runner.invoke(cli, ["completion", "--help"])
+        assert result.exit_code == 0
+        assert "Print a static SHELL completion script" in result.output
+
+    @pytest.mark.parametrize("shell", ["bash", "zsh"])
+    def test_completion_command_bash_and_zsh(self, runner, cli, shell):
+        """Test the bash compatible completion scripts contain the command tree."""
+        result = runner.invoke(cli, ["completion", shell])
+        assert result.exit_code == 0
+        assert "complete -o default -F _testing_project_completion testing-project" in result.output
+        assert "completion|list|plugins|run|shell)" in result.output
+        assert 'plugins) COMPREPLY=($(compgen -W "-h --help hello"' in result.output
+        assert "--search-git-root" in result.output
+
+    @pytest.mark.skipif(shutil.which("bash") is None, reason="bash is not available")
+    def test_completion_command_bash_script_completes(self, runner, cli, tmp_path):
+        """Test the generated bash script completes subcommands without invoking Python."""
+        result = runner.invoke(cli, ["completion", "bash"])
+        script = tmp_path / "completion.bash"
+        script.write_text(result.output)
+
+        completed = subprocess.run(
+            [
+                "bash",
+                "-c",
+                f"source {script}; COMP_WORDS=(testing-project -d ru); COMP_CWORD=2; "
+                '_testing_project_completion; echo "${COMPREPLY[@]}"',
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        assert completed.stdout.strip() == "run"
+
+    def test_completion_command_fish(self, runner, cli):
+        """Test the fish completion script contains the command tree."""
+        result = runner.invoke(cli, ["completion", "fish"])
+        assert result.exit_code == 0
+        assert "-l config-path -s c -r" in result.output
+        assert "-n '__fish_seen_subcommand_from completion' -f -a 'bash zsh fish'" in result.output
+        assert "-n '__fish_seen_subcommand_from plugins' -f -a 'hello'" in result.output
+
+    def test_completion_command_invalid_shell(self, runner, cli):
+        """Test the 'completion' command rejects unsupported shells."""
+        result = runner.invoke(cli, ["completion", "powershell"])
+        assert result.exit_code == 2
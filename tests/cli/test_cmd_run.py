@@ -1,19 +1,35 @@
 from dataclasses import dataclass
 from pathlib import Path
 
+import pytest
+
 from hamilton_composer.cli.factory import build_cli
 from hamilton_composer.composer import HamiltonComposer
 
+from ..defs.functions import LOGGER_NAME as NODES_LOGGER
+
+
+@dataclass
+class NumbersSchema:
+    numbers: list[int]
+
+
+@pytest.fixture
+def parameters_file(runner, request):
+    """Fixture to write the (indirectly parametrized) parameters to `parameters.yaml`."""
+    import yaml
+
+    path = Path("parameters.yaml")
+    path.write_text(yaml.safe_dump(request.param))
+    return path
+
 
 class TestRunPipelineWithNoConfig:
     """Test running pipelines without configuration files."""
 
-    def test_run_with_no_config(self, runner):
+    def test_run_with_no_config(self, runner, default_cli):
         """Test pipeline execution without any configuration."""
-        composer = HamiltonComposer("tests.defs.pipelines.create_pipelines")
-        cli = build_cli("test-project", composer)
-
-        result = runner.invoke(cli, ["run", "simple_pipeline", "numbers=[2,3,4]"])
+        result = runner.invoke(default_cli, ["run", "simple_pipeline", "numbers=[2,3,4]"])
         assert result.exit_code == 0
         assert "sum_doubled = 18" in result.output
 
@@ -21,33 +37,26 @@ class TestRunPipelineWithNoConfig:
 class TestRunPipelineWithConfig:
     """Test running pipelines with configuration files."""
 
-    def test_run_with_config_path(self, runner):
-        """Test pipeline execution with YAML configuration file."""
-        parameters_file = Path("parameters.yaml")
-        parameters_file.write_text("numbers: [1, 2, 3]")
-
+    @pytest.mark.parametrize("parameters_file", [{"numbers": [1, 2, 3]}], indirect=True)
+    @pytest.mark.parametrize(
+        "schema, args, expected",
+        [
+            (None, [], "sum_doubled = 12"),
+            (None, ["numbers=[2,3,4]"], "sum_doubled = 18"),
+            (NumbersSchema, [], "sum_doubled = 12"),
+        ],
+        ids=["config_path", "config_and_override", "schema_validation"],
+    )
+    def test_run_with_config_file(self, runner, parameters_file, schema, args, expected):
+        """Test pipeline execution with a YAML configuration file (and optional schema)."""
         composer = HamiltonComposer(
-            "tests.defs.pipelines.create_pipelines", config_path=parameters_file
+            "tests.defs.pipelines.create_pipelines", config_path=parameters_file, schema=schema
         )
-        cli = build_cli("test-project", composer)
+        cli = build_cli("test-project", composer, logger=NODES_LOGGER)
 
-        result = runner.invoke(cli, ["run", "simple_pipeline"])
+        result = runner.invoke(cli, ["run", "simple_pipeline", *args])
         assert result.exit_code == 0
-        assert "sum_doubled = 12" in result.output
-
-    def test_run_with_config_and_override(self, runner):
-        """Test pipeline execution with config file and parameter override."""
-        parameters_file = Path("parameters.yaml")
-        parameters_file.write_text("numbers: [1, 2, 3]")
-
-        composer = HamiltonComposer(
-            "tests.defs.pipelines.create_pipelines", config_path=parameters_file
-        )
-        cli = build_cli("test-project", composer)
-
-        result = runner.invoke(cli, ["run", "simple_pipeline", "numbers=[2,3,4]"])
-        assert result.exit_code == 0
-        assert "sum_doubled = 18" in result.output
+        assert expected in result.output
 
     def test_run_with_config_directory(self, runner):
         """Test pipeline execution with a configuration directory."""
@@ -59,26 +68,7 @@ class TestRunPipelineWithConfig:
         composer = HamiltonComposer(
             "tests.defs.pipelines.create_pipelines", config_path=parameters_dir
         )
-        cli = build_cli("test-project", composer)
-
-        result = runner.invoke(cli, ["run", "simple_pipeline"])
-        assert result.exit_code == 0
-        assert "sum_doubled = 12" in result.output
-
-    def test_run_with_schema_validation(self, runner):
-        """Test pipeline execution with schema validation."""
-
-        @dataclass
-        class Config:
-            numbers: list[int]
-
-        parameters_file = Path("parameters.yaml")
-        parameters_file.write_text("numbers: [1, 2, 3]")
-
-        composer = HamiltonComposer(
-            "tests.defs.pipelines.create_pipelines", config_path=parameters_file, schema=Config
-        )
-        cli = build_cli("test-project", composer)
+        cli = build_cli("test-project", composer, logger=NODES_LOGGER)
 
         result = runner.invoke(cli, ["run", "simple_pipeline"])
         assert result.exit_code == 0
@@ -88,12 +78,9 @@ class TestRunPipelineWithConfig:
 class TestRunPipelineErrors:
     """Test error handling in the run command."""
 
-    def test_run_nonexistent_pipeline(self, runner):
+    def test_run_nonexistent_pipeline(self, runner, default_cli):
         """Test error when trying to run a pipeline that doesn't exist."""
-        composer = HamiltonComposer("tests.defs.pipelines.create_pipelines")
-        cli = build_cli("test-project", composer)
-
-        result = runner.invoke(cli, ["run", "nonexistent_pipeline"])
+        result = runner.invoke(default_cli, ["run", "nonexistent_pipeline"])
         assert result.exit_code != 0
         assert "Pipeline 'nonexistent_pipeline' not found" in result.output
 
@@ -111,7 +98,7 @@ class TestRunPipelineErrors:
             return {"private_pipeline": private_pipeline}
 
         composer = HamiltonComposer(create_private_pipeline)
-        cli = build_cli("test-project", composer)
+        cli = build_cli("test-project", composer, logger=NODES_LOGGER)
 
         result = runner.invoke(cli, ["run", "private_pipeline"])
         assert result.exit_code != 0
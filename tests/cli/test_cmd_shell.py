@@ -1,167 +1,100 @@
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
 from unittest.mock import Mock
-from unittest.mock import patch
 
-from click.testing import CliRunner
+import pytest
 
 from hamilton_composer.cli.cmds.shell import launch_ipython_shell
 
-
-class TestShellCommand:
-    """Test suite for the shell CLI command."""
-
-    @patch("hamilton_composer.exts.ipython.launch_shell")
-    def test_shell_command_launches_successfully(self, mock_launch_shell):
-        """Test that the shell command launches the IPython shell successfully."""
-        # Arrange
-        mock_context = Mock()
-        mock_config = {"test": "config"}
-        mock_pipelines = {"pipeline1": Mock(), "pipeline2": Mock()}
-        mock_context.load_config.return_value = mock_config
-        mock_context.find_pipelines.return_value = mock_pipelines
-
-        runner = CliRunner()
-
-        # Act
-        result = runner.invoke(launch_ipython_shell, [], obj=mock_context)
-
-        # Assert
-        assert result.exit_code == 0
-        mock_context.load_config.assert_called_once_with(())
-        mock_context.find_pipelines.assert_called_once_with(mock_config)
-        mock_launch_shell.assert_called_once_with(config=mock_config, pipelines=mock_pipelines)
-
-    @patch("hamilton_composer.exts.ipython.launch_shell")
-    def test_shell_command_with_params(self, mock_launch_shell):
-        """Test that the shell command correctly passes params to config loading."""
-        # Arrange
-        mock_context = Mock()
-        mock_config = {"env": "test", "debug": True}
-        mock_pipelines = {"pipeline1": Mock()}
-        mock_context.load_config.return_value = mock_config
-        mock_context.find_pipelines.return_value = mock_pipelines
-
-        runner = CliRunner()
-        params = ["env=production", "debug=false"]
-
-        # Act
-        result = runner.invoke(launch_ipython_shell, params, obj=mock_context)
-
-        # Assert
-        assert result.exit_code == 0
-        mock_context.load_config.assert_called_once_with(("env=production", "debug=false"))
-        mock_context.find_pipelines.assert_called_once_with(mock_config)
-        mock_launch_shell.assert_called_once_with(config=mock_config, pipelines=mock_pipelines)
-
-    @patch("hamilton_composer.exts.ipython.launch_shell")
-    def test_shell_command_with_empty_config_and_pipelines(self, mock_launch_shell):
-        """Test that the shell command works with empty config and pipelines."""
-        # Arrange
-        mock_context = Mock()
-        empty_config = {}
-        empty_pipelines = {}
-        mock_context.load_config.return_value = empty_config
-        mock_context.find_pipelines.return_value = empty_pipelines
-
-        runner = CliRunner()
-
-        # Act
-        result = runner.invoke(launch_ipython_shell, [], obj=mock_context)
-
-        # Assert
-        assert result.exit_code == 0
-        mock_context.load_config.assert_called_once_with(())
-        mock_context.find_pipelines.assert_called_once_with(empty_config)
-        mock_launch_shell.assert_called_once_with(config=empty_config, pipelines=empty_pipelines)
-
-    @patch("hamilton_composer.exts.ipython.launch_shell")
-    def test_shell_command_context_flow(self, mock_launch_shell):
-        """Test that the shell command correctly flows config through the context."""
-        # Arrange
-        mock_context = Mock()
-        test_config = {
+# Pipelines are only passed through and compared by identity, plain sentinels are sufficient
+PIPELINE_1 = object()
+PIPELINE_2 = object()
+
+
+@dataclass(frozen=True)
+class ShellCase:
+    """Inputs and failure points of a single shell command invocation."""
+
+    config: dict[str, Any] = field(default_factory=dict)
+    pipelines: dict[str, Any] = field(default_factory=dict)
+    params: tuple[str, ...] = ()
+    load_error: Exception | None = None
+    find_error: Exception | None = None
+    launch_error: Exception | None = None
+
+    @property
+    def expect_success(self) -> bool:
+        return not (self.load_error or self.find_error or self.launch_error)
+
+
+SHELL_CASES = {
+    "launches_successfully": ShellCase(
+        config={"test": "config"},
+        pipelines={"pipeline1": PIPELINE_1, "pipeline2": PIPELINE_2},
+    ),
+    "with_params": ShellCase(
+        config={"env": "test", "debug": True},
+        pipelines={"pipeline1": PIPELINE_1},
+        params=("env=production", "debug=false"),
+    ),
+    "with_empty_config_and_pipelines": ShellCase(),
+    "context_flow": ShellCase(
+        config={
             "database": {"host": "localhost", "port": 5432},
             "pipeline_settings": {"batch_size": 100},
-        }
-        test_pipelines = {
-            "etl_pipeline": Mock(name="etl_pipeline"),
-            "ml_pipeline": Mock(name="ml_pipeline"),
-        }
-        mock_context.load_config.return_value = test_config
-        mock_context.find_pipelines.return_value = test_pipelines
-
-        runner = CliRunner()
-
-        # Act
-        result = runner.invoke(launch_ipython_shell, [], obj=mock_context)
-
-        # Assert
-        assert result.exit_code == 0
-
-        # Verify that config is loaded first
-        mock_context.load_config.assert_called_once_with(())
-
-        # Verify that pipelines are found using the loaded config
-        mock_context.find_pipelines.assert_called_once_with(test_config)
-
-        # Verify that launch_shell is called with both config and pipelines
-        mock_launch_shell.assert_called_once_with(config=test_config, pipelines=test_pipelines)
-
-    @patch("hamilton_composer.exts.ipython.launch_shell")
-    def test_shell_command_handles_config_loading_error(self, mock_launch_shell):
-        """Test that the shell command properly handles config loading errors."""
-        # Arrange
-        mock_context = Mock()
-        mock_context.load_config.side_effect = Exception("Config loading failed")
+        },
+        pipelines={"etl_pipeline": PIPELINE_1, "ml_pipeline": PIPELINE_2},
+    ),
+    "handles_config_loading_error": ShellCase(
+        load_error=Exception("Config loading failed"),
+    ),
+    "handles_pipeline_finding_error": ShellCase(
+        config={"test": "config"},
+        find_error=Exception("Pipeline finding failed"),
+    ),
+    "handles_shell_launch_error": ShellCase(
+        config={"test": "config"},
+        pipelines={"test": PIPELINE_1},
+        launch_error=Exception("Shell launch failed"),
+    ),
+}
+
+
+@pytest.fixture
+def mock_launch_shell(mocker):
+    """Fixture to replace the IPython shell launcher with a mock."""
+    return mocker.patch("hamilton_composer.exts.ipython.launch_shell")
 
-        runner = CliRunner()
 
-        # Act
-        result = runner.invoke(launch_ipython_shell, [], obj=mock_context)
-
-        # Assert
-        assert result.exit_code != 0
-        mock_context.load_config.assert_called_once_with(())
-        mock_context.find_pipelines.assert_not_called()
-        mock_launch_shell.assert_not_called()
-
-    @patch("hamilton_composer.exts.ipython.launch_shell")
-    def test_shell_command_handles_pipeline_finding_error(self, mock_launch_shell):
-        """Test that the shell command properly handles pipeline finding errors."""
-        # Arrange
-        mock_context = Mock()
-        mock_config = {"test": "config"}
-        mock_context.load_config.return_value = mock_config
-        mock_context.find_pipelines.side_effect = Exception("Pipeline finding failed")
-
-        runner = CliRunner()
-
-        # Act
-        result = runner.invoke(launch_ipython_shell, [], obj=mock_context)
+class TestShellCommand:
+    """Test suite for the shell CLI command."""
 
-        # Assert
-        assert result.exit_code != 0
-        mock_context.load_config.assert_called_once_with(())
-        mock_context.find_pipelines.assert_called_once_with(mock_config)
-        mock_launch_shell.assert_not_called()
-
-    @patch("hamilton_composer.exts.ipython.launch_shell")
-    def test_shell_command_handles_shell_launch_error(self, mock_launch_shell):
-        """Test that the shell command properly handles shell launch errors."""
+    @pytest.mark.parametrize("case", SHELL_CASES.values(), ids=SHELL_CASES.keys())
+    def test_shell_command(self, runner, mock_launch_shell, case: ShellCase):
+        """Test that the shell command flows config and pipelines from the context to the shell."""
         # Arrange
         mock_context = Mock()
-        mock_config = {"test": "config"}
-        mock_pipelines = {"test": Mock()}
-        mock_context.load_config.return_value = mock_config
-        mock_context.find_pipelines.return_value = mock_pipelines
-        mock_launch_shell.side_effect = Exception("Shell launch failed")
-
-        runner = CliRunner()
+        mock_context.load_config.return_value = case.config
+        mock_context.load_config.side_effect = case.load_error
+        mock_context.find_pipelines.return_value = case.pipelines
+        mock_context.find_pipelines.side_effect = case.find_error
+        mock_launch_shell.side_effect = case.launch_error
 
         # Act
-        result = runner.invoke(launch_ipython_shell, [], obj=mock_context)
+        result = runner.invoke(launch_ipython_shell, list(case.params), obj=mock_context)
 
         # Assert
-        assert result.exit_code != 0
-        mock_context.load_config.assert_called_once_with(())
-        mock_context.find_pipelines.assert_called_once_with(mock_config)
-        mock_launch_shell.assert_called_once_with(config=mock_config, pipelines=mock_pipelines)
+        assert (result.exit_code == 0) is case.expect_success
+        mock_context.load_config.assert_called_once_with(case.params)
+
+        # Each stage is only reached when all of the previous stages succeeded
+        if case.load_error:
+            mock_context.find_pipelines.assert_not_called()
+        else:
+            mock_context.find_pipelines.assert_called_once_with(case.config)
+
+        if case.load_error or case.find_error:
+            mock_launch_shell.assert_not_called()
+        else:
+            mock_launch_shell.assert_called_once_with(config=case.config, pipelines=case.pipelines)
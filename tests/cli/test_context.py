@@ -1,28 +1,35 @@
 from hamilton_composer.cli.context import AppContext
-from hamilton_composer.composer import HamiltonComposer
+from hamilton_composer.logging import get_default_logger
 
 
 class TestAppContext:
     """Test AppContext properties intended for plugins."""
 
-    def test_context_name_property(self):
+    def test_context_name_property(self, default_composer):
         """Test accessing the context name property."""
-        from hamilton_composer.logging import get_default_logger
-
-        composer = HamiltonComposer("tests.defs.pipelines.create_pipelines")
         logger = get_default_logger()
 
-        context = AppContext(name="test-project", composer=composer, logger=logger)
+        context = AppContext(name="test-project", composer=default_composer, logger=logger)
 
         assert context.name == "test-project"
 
-    def test_context_logger_property(self):
+    def test_context_logger_property(self, default_composer):
         """Test accessing the context logger property."""
-        from hamilton_composer.logging import get_default_logger
-
-        composer = HamiltonComposer("tests.defs.pipelines.create_pipelines")
         logger = get_default_logger()
 
-        context = AppContext(name="test-project", composer=composer, logger=logger)
+        context = AppContext(name="test-project", composer=default_composer, logger=logger)
 
         assert context.logger is logger
+
+    def test_context_public_pipelines_are_sorted_and_cached(self, default_composer):
+        """Test public pipelines are sorted by name and reused for the same configuration."""
+        logger = get_default_logger()
+        context = AppContext(name="test-project", composer=default_composer, logger=logger)
+
+        config: dict = {}
+        pipelines = context.find_public_pipelines(config)
+        names = [name for name, _ in pipelines]
+        assert names == sorted(names)
+        assert all(pipeline.public for _, pipeline in pipelines)
+        assert context.find_public_pipelines(config) is pipelines
+        assert context.find_public_pipelines({}) is not pipelines
@@ -1,17 +1,16 @@
+import sys
 from pathlib import Path
 
-from click.testing import CliRunner
+import click
 
 from hamilton_composer.cli.factory import build_cli
-from hamilton_composer.composer import HamiltonComposer
 
 
 class TestCLIFactory:
     """Test CLI factory functionality and edge cases."""
 
-    def test_cli_with_plugins(self):
+    def test_cli_with_plugins(self, runner, default_composer):
         """Test CLI factory with plugins."""
-        import click
 
         @click.command()
         def test_plugin():
@@ -23,11 +22,9 @@ class TestCLIFactory:
             """Another test plugin command."""
             pass
 
-        composer = HamiltonComposer("tests.defs.pipelines.create_pipelines")
         # Test with multiple plugins to ensure the plugin iteration works
-        cli = build_cli("test-project", composer, plugins=[test_plugin, another_plugin])
+        cli = build_cli("test-project", default_composer, plugins=[test_plugin, another_plugin])
 
-        runner = CliRunner()
         # Test plugin group help
         result = runner.invoke(cli, ["plugins", "--help"])
         assert result.exit_code == 0
@@ -37,31 +34,56 @@ class TestCLIFactory:
         result = runner.invoke(cli, ["plugins", "test-plugin", "--help"])
         assert result.exit_code == 0
 
-    def test_cli_with_string_logger(self):
+    def test_cli_with_string_logger(self, default_composer):
         """Test CLI factory with string logger name."""
-        composer = HamiltonComposer("tests.defs.pipelines.create_pipelines")
-        cli = build_cli("test-project", composer, logger="test.logger")
+        cli = build_cli("test-project", default_composer, logger="test.logger")
 
         # Should build successfully without errors
         assert cli is not None
 
-    def test_cli_with_log_file(self):
+    def test_cli_with_log_file(self, default_composer):
         """Test CLI factory with log file configuration."""
-        composer = HamiltonComposer("tests.defs.pipelines.create_pipelines")
-        cli = build_cli("test-project", composer, log_file=Path("test.log"))
+        cli = build_cli("test-project", default_composer, log_file=Path("test.log"))
 
         # Should build successfully without errors
         assert cli is not None
 
-    def test_cli_context_creation(self):
-        """Test CLI context object creation."""
-        composer = HamiltonComposer("tests.defs.pipelines.create_pipelines")
-        cli = build_cli("test-project", composer)
+    def test_cli_is_built_fresh_for_identical_arguments(self, default_composer):
+        """Test that building the same CLI twice returns independent applications."""
+        cli = build_cli("test-project", default_composer)
+        other = build_cli("test-project", default_composer)
+        assert other is not cli
+
+        other.add_command(click.Command("extra"))
+        assert "extra" not in cli.commands
+
+    def test_cli_pretty_errors_only_for_executing_commands(self, runner, default_cli, mocker):
+        """Test that pretty errors are only installed for commands that execute pipelines."""
+        mock_install = mocker.patch("hamilton_composer.cli.factory._install_pretty_errors")
+
+        result = runner.invoke(default_cli, ["list"])
+        assert result.exit_code == 0
+        mock_install.assert_not_called()
+
+        result = runner.invoke(default_cli, ["run", "simple_pipeline", "numbers=[1]"])
+        assert result.exit_code == 0
+        mock_install.assert_called_once()
+
+    def test_cli_skips_omegaconf_without_config_path(
+        self, runner, default_cli, mocker, monkeypatch
+    ):
+        """Test that OmegaConf is not imported up front when there is no configuration path."""
+        mocker.patch("hamilton_composer.exts.ipython.launch_shell")
+        monkeypatch.delitem(sys.modules, "omegaconf", raising=False)
+
+        result = runner.invoke(default_cli, ["shell"])
+        assert result.exit_code == 0
+        assert "omegaconf" not in sys.modules
 
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            config_path = Path("config.yaml")
-            config_path.write_text("test: value")
+    def test_cli_context_creation(self, runner, default_cli):
+        """Test CLI context object creation."""
+        config_path = Path("config.yaml")
+        config_path.write_text("test: value")
 
-            result = runner.invoke(cli, ["--config-path", str(config_path), "list"])
-            assert result.exit_code == 0
+        result = runner.invoke(default_cli, ["--config-path", str(config_path), "list"])
+        assert result.exit_code == 0
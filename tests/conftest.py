@@ -0,0 +1,26 @@
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from hamilton_composer.utils import clear_git_root_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_git_root_cache() -> None:
+    """Fixture to forget git roots found by earlier tests (directories may be reused or removed)."""
+    clear_git_root_cache()
+
+
+@pytest.fixture
+def fake_git_repo() -> Callable[[Path], Path]:
+    """Fixture to scaffold a minimal git repository (without spawning `git init`)."""
+
+    def scaffold(path: Path) -> Path:
+        git_dir = path / ".git"
+        (git_dir / "objects").mkdir(parents=True)
+        (git_dir / "refs" / "heads").mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        return path
+
+    return scaffold
@@ -1,21 +1,27 @@
 """Simple Hamilton test nodes for basic math operations."""
 
+import logging
 from typing import List
 
 from hamilton.function_modifiers import config
 
+# Name of the logger the nodes report their results to (i.e. `sum_doubled = 12`)
+LOGGER_NAME = __name__
+
+logger = logging.getLogger(LOGGER_NAME)
+
 
 def doubled_numbers(numbers: List[int]) -> List[int]:
     """Double each number in the list."""
     result = [n * 2 for n in numbers]
-    print(f"doubled_numbers = {result}")
+    logger.info("doubled_numbers = %s", result)
     return result
 
 
 def sum_doubled(doubled_numbers: List[int]) -> int:
     """Sum of all doubled numbers."""
     result = sum(doubled_numbers)
-    print(f"sum_doubled = {result}")
+    logger.info("sum_doubled = %s", result)
     return result
 
 
@@ -23,7 +29,7 @@ def sum_doubled(doubled_numbers: List[int]) -> int:
 def transformed_sum__add(sum_doubled: int, factor: int) -> int:
     """Add factor to sum."""
     result = sum_doubled + factor
-    print(f"transformed_sum__add = {result}")
+    logger.info("transformed_sum__add = %s", result)
     return result
 
 
@@ -31,5 +37,5 @@ def transformed_sum__add(sum_doubled: int, factor: int) -> int:
 def transformed_sum__multiply(sum_doubled: int, factor: int) -> int:
     """Multiply sum by factor."""
     result = sum_doubled * factor
-    print(f"transformed_sum__multiply = {result}")
+    logger.info("transformed_sum__multiply = %s", result)
     return result
@@ -0,0 +1,17 @@
+"""Hamilton test nodes combining constants with a `factor` input."""
+
+
+def A() -> int:
+    return 1
+
+
+def B() -> int:
+    return 2
+
+
+def C() -> int:
+    return 3
+
+
+def D(A: int, B: int, C: int, factor: int) -> int:
+    return (A + B + C) * factor
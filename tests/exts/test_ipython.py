@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 from unittest.mock import Mock
-from unittest.mock import patch
+
+import pytest
 
 from hamilton_composer.exts.ipython import launch_shell
 
@@ -8,19 +9,39 @@ if TYPE_CHECKING:
     from hamilton_composer.pipeline import Pipeline
 
 
+# Pipelines are only passed through and compared by identity, plain sentinels are sufficient
+PIPELINE_1 = object()
+PIPELINE_2 = object()
+
+
+@pytest.fixture
+def mock_shell_class(mocker):
+    """Fixture to replace the embedded IPython shell class with a mock."""
+    return mocker.patch("IPython.terminal.embed.InteractiveShellEmbed")
+
+
+@pytest.fixture
+def mock_load_config(mocker):
+    """Fixture to replace the IPython configuration loader with a mock."""
+    return mocker.patch("IPython.terminal.ipapp.load_default_config")
+
+
+@pytest.fixture
+def mock_get_console(mocker):
+    """Fixture to replace the rich console accessor with a mock."""
+    return mocker.patch("rich.get_console")
+
+
 class TestIPythonIntegration:
     """Test suite for IPython integration functionality."""
 
-    @patch("hamilton_composer.exts.ipython.InteractiveShellEmbed")
-    @patch("hamilton_composer.exts.ipython.load_default_config")
-    @patch("rich.get_console")
     def test_launch_shell_creates_shell_with_correct_config(
         self, mock_get_console, mock_load_config, mock_shell_class
     ):
         """Test that launch_shell creates an IPython shell with the correct configuration."""
         # Arrange
         mock_config = {"test": "config"}
-        mock_pipelines: dict[str, "Pipeline"] = {"pipeline1": Mock(), "pipeline2": Mock()}
+        mock_pipelines: dict[str, "Pipeline"] = {"pipeline1": PIPELINE_1, "pipeline2": PIPELINE_2}
         mock_ipython_config = {"ipython": "config"}
         mock_shell_instance = Mock()
         mock_console = Mock()
@@ -41,16 +62,13 @@ class TestIPythonIntegration:
         mock_shell_instance.show_banner.assert_called_once()
         mock_shell_instance.mainloop.assert_called_once()
 
-    @patch("hamilton_composer.exts.ipython.InteractiveShellEmbed")
-    @patch("hamilton_composer.exts.ipython.load_default_config")
-    @patch("rich.get_console")
     def test_launch_shell_displays_welcome_message(
         self, mock_get_console, mock_load_config, mock_shell_class
     ):
         """Test that launch_shell displays the correct welcome message."""
         # Arrange
         mock_config = {"test": "config"}
-        mock_pipelines: dict[str, "Pipeline"] = {"pipeline1": Mock()}
+        mock_pipelines: dict[str, "Pipeline"] = {"pipeline1": PIPELINE_1}
         mock_console = Mock()
         mock_get_console.return_value = mock_console
 
@@ -63,9 +81,6 @@ class TestIPythonIntegration:
         assert "Hamilton Composer IPython shell" in call_args
         assert "Preloaded variables: 'config' and 'pipelines'" in call_args
 
-    @patch("hamilton_composer.exts.ipython.InteractiveShellEmbed")
-    @patch("hamilton_composer.exts.ipython.load_default_config")
-    @patch("rich.get_console")
     def test_launch_shell_pushes_correct_namespace(
         self, mock_get_console, mock_load_config, mock_shell_class
     ):
@@ -76,8 +91,8 @@ class TestIPythonIntegration:
             "features": ["feature1", "feature2"],
         }
         test_pipelines: dict[str, "Pipeline"] = {
-            "data_pipeline": Mock(name="data_pipeline"),
-            "ml_pipeline": Mock(name="ml_pipeline"),
+            "data_pipeline": PIPELINE_1,
+            "ml_pipeline": PIPELINE_2,
         }
         mock_shell_instance = Mock()
         mock_shell_class.return_value = mock_shell_instance
@@ -12,6 +12,12 @@ from hamilton_composer.logging import configure_logging
 from hamilton_composer.logging import get_default_logger
 
 
+@pytest.fixture(autouse=True)
+def reset_logging_signature(monkeypatch):
+    """Forget the last applied configuration so that each test configures logging from scratch."""
+    monkeypatch.setattr("hamilton_composer.logging._last_config_signature", None)
+
+
 @pytest.fixture
 def mock_logging_setup(mocker):
     """Set up common mocks for logging tests."""
@@ -122,6 +128,47 @@ class TestConfigureLogging:
             assert config_arg["loggers"][name]["level"] == "INFO"
             assert config_arg["loggers"][name]["handlers"] == ["console"]
 
+    def test_configure_logging_repeated_calls_are_independent(self, mock_logging_setup):
+        """Test that repeated calls do not leak modifications through the cached defaults."""
+        mock_dict_config = mock_logging_setup
+
+        configure_logging("first.logger")
+        configure_logging(log_file="run.log")
+
+        first_config = mock_dict_config.call_args_list[0][0][0]
+        second_config = mock_dict_config.call_args_list[1][0][0]
+        assert first_config is not second_config
+        assert "rotating_file" in second_config["handlers"]
+        assert "first.logger" not in second_config["loggers"]
+
+    def test_configure_logging_only_debug_changed(self, mock_logging_setup):
+        """Test that changing only the debug flag updates logger levels in place."""
+        mock_dict_config = mock_logging_setup
+
+        configure_logging("level.logger")
+        configure_logging("level.logger", debug=True)
+
+        mock_dict_config.assert_called_once()
+        assert logging.getLogger("level.logger").level == logging.DEBUG
+
+        configure_logging("other.logger", debug=True)
+        assert mock_dict_config.call_count == 2
+
+    def test_configure_logging_reapplied_after_external_changes(self, mocker):
+        """Test that the configuration is rebuilt when its handlers were removed elsewhere."""
+        spy_dict_config = mocker.spy(logging.config, "dictConfig")
+
+        configure_logging("reconfigured.logger", include_defaults=False)
+        logger = logging.getLogger("reconfigured.logger")
+        assert logger.handlers
+
+        logger.handlers.clear()
+        configure_logging("reconfigured.logger", include_defaults=False, debug=True)
+
+        assert spy_dict_config.call_count == 2
+        assert logger.handlers
+        assert logger.level == logging.DEBUG
+
 
 class TestGetDefaultLogger:
     """Test suite for the get_default_logger function."""
@@ -238,3 +285,21 @@ class TestMillisecondFormatter:
         assert "test.logger" in formatted_message
         assert "INFO" in formatted_message
         assert "Test message" in formatted_message
+
+    def test_format_time_across_seconds(self):
+        """Test that the cached timestamp is refreshed when the second changes."""
+        formatter = MillisecondFormatter()
+        formatter.converter = time.gmtime
+
+        record = logging.LogRecord(
+            name="test", level=logging.INFO, pathname="", lineno=0, msg="", args=(), exc_info=None
+        )
+
+        record.created, record.msecs = 1640995200.5, 500.0
+        assert formatter.formatTime(record) == "2022-01-01 00:00:00.500"
+
+        record.created, record.msecs = 1640995200.75, 750.0
+        assert formatter.formatTime(record) == "2022-01-01 00:00:00.750"
+
+        record.created, record.msecs = 1640995201.25, 250.0
+        assert formatter.formatTime(record) == "2022-01-01 00:00:01.250"
@@ -1,33 +1,62 @@
-import os
-import subprocess
 from pathlib import Path
 
 import pytest
 
+from hamilton_composer.utils import clear_git_root_cache
 from hamilton_composer.utils import get_git_root
 
 
 class TestGetGitRoot:
-    def test_get_git_root_from_root(self, tmp_path: Path) -> None:
-        root_path = tmp_path
-        os.chdir(tmp_path)
-        subprocess.run(["git", "init"])
-        assert get_git_root() == root_path
-
-    def test_get_git_root_from_subdirectory(self, tmp_path: Path) -> None:
-        root_path = tmp_path
-        os.chdir(tmp_path)
-        subprocess.run(["git", "init"])
+    @pytest.mark.parametrize(
+        ("scaffold", "start", "raise_error", "expected"),
+        [
+            pytest.param(True, ".", True, ".", id="from_root"),
+            pytest.param(True, "subdir", True, ".", id="from_subdirectory"),
+            pytest.param(False, ".", False, None, id="can_ignore_errors"),
+            pytest.param(False, ".", True, RuntimeError, id="raises_error"),
+        ],
+    )
+    def test_get_git_root(
+        self,
+        tmp_path: Path,
+        fake_git_repo,
+        scaffold: bool,
+        start: str,
+        raise_error: bool,
+        expected: str | type[Exception] | None,
+    ) -> None:
+        root_path = tmp_path.resolve()
+        if scaffold:
+            fake_git_repo(tmp_path)
+        cwd = tmp_path / start
+        cwd.mkdir(exist_ok=True)
+
+        if isinstance(expected, type):
+            with pytest.raises(expected):
+                get_git_root(raise_error=raise_error, cwd=cwd)
+        elif expected is None:
+            assert get_git_root(raise_error=raise_error, cwd=cwd) is None
+        else:
+            assert get_git_root(raise_error=raise_error, cwd=cwd) == root_path / expected
+
+    def test_get_git_root_from_working_directory(
+        self, tmp_path: Path, fake_git_repo, monkeypatch
+    ) -> None:
+        fake_git_repo(tmp_path)
         sub = tmp_path / "subdir"
         sub.mkdir()
-        os.chdir(sub)
-        assert get_git_root() == root_path
+        monkeypatch.chdir(sub)
+        assert get_git_root() == tmp_path.resolve()
 
-    def test_get_git_root_can_ignore_errors(self, tmp_path: Path) -> None:
-        os.chdir(tmp_path)
-        assert get_git_root(raise_error=False) is None
+    def test_get_git_root_resolves_symlinks(self, tmp_path: Path, fake_git_repo) -> None:
+        root_path = fake_git_repo(tmp_path / "repo")
+        link = tmp_path / "link"
+        link.symlink_to(root_path, target_is_directory=True)
+        assert get_git_root(cwd=link) == root_path.resolve()
 
-    def test_get_git_root_raises_error(self, tmp_path: Path) -> None:
-        os.chdir(tmp_path)
-        with pytest.raises(RuntimeError):
-            get_git_root(raise_error=True)
+    def test_get_git_root_is_cached(self, tmp_path: Path) -> None:
+        assert get_git_root(raise_error=False, cwd=tmp_path) is None
+        (tmp_path / ".git").mkdir()
+        assert get_git_root(raise_error=False, cwd=tmp_path) is None
+        clear_git_root_cache()
+        assert get_git_root(raise_error=False, cwd=tmp_path) == tmp_path.resolve()